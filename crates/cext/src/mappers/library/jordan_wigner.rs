@@ -61,12 +61,20 @@ use qiskit_fermions_core::operators::fermion_operator::FermionOperator;
 /// .. code-block:: c
 ///     :linenos:
 ///
-///     // define some kind of fermionic operator
-///     QfFermionOperator *hamil = qf_ferm_op_one();
+///     // define some kind of fermionic operator directly from its term arrays
+///     bool actions[4] = {true, false, true, false};
+///     uint32_t indices[4] = {0, 1, 2, 3};
+///     QkComplex64 coeffs[2] = {{1.0, 0.0}, {0.0, -1.0}};
+///     uint32_t boundaries[3] = {0, 2, 4};
+///     QfFermionOperator *hamil = qf_ferm_op_new(2, 4, coeffs, actions, indices, boundaries);
 ///
 ///     // and map it to a qubit operator
 ///     QkObs *result = qf_jordan_wigner(hamil, 4);
 ///
+/// Since both the construction of the operator from its term arrays (see
+/// :c:func:`qf_ferm_op_new`) and its mapping happen natively, this does not involve Python at
+/// any point.
+///
 /// @endrst
 #[unsafe(no_mangle)]
 pub unsafe extern "C" fn qf_jordan_wigner(
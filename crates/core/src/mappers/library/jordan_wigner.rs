@@ -10,35 +10,126 @@
 // copyright notice, and modified files need to carry a notice indicating
 // that they have been altered from the originals.
 
-use crate::operators::fermion_operator::{FermionAction, FermionOperator};
+use crate::operators::fermion_operator::{FermionOperator, FermionOperatorTermView};
+use num_complex::Complex64;
+use num_traits::Zero;
+#[cfg(feature = "rayon")]
 use rayon::prelude::*;
-use std::mem::MaybeUninit;
-use std::sync::{Arc, Mutex};
+use std::collections::HashMap;
+
+const WORD_BITS: usize = u64::BITS as usize;
+
+/// A Pauli string in its symplectic form `X^x Z^z` (up to a phase).
+///
+/// The `x` and `z` bitmasks are stored back-to-back, such that the first half of the words holds
+/// the `x` support and the second half holds the `z` support.
+type PauliMask = Vec<u64>;
+
+/// Expands a single term into its (not necessarily unique) Pauli strings.
+///
+/// Every action maps to `Z_{<j} (X_j ∓ iY_j) / 2 = Z_{<j} X_j (1 ± Z_j) / 2`. Thus, multiplying a
+/// Pauli string `X^x Z^z` by it from the right only flips bits of its masks and picks up a sign of
+/// `(-1)^{z_j}` from commuting `Z_j` past `X_j`.
+fn expand_term(term: FermionOperatorTermView, num_words: usize) -> Vec<(PauliMask, Complex64)> {
+    let mut strings = vec![(vec![0; 2 * num_words], term.coeff)];
+    for (action, index) in term.iter() {
+        let index = *index as usize;
+        let (word, bit) = (index / WORD_BITS, 1u64 << (index % WORD_BITS));
+        let mut expanded = Vec::with_capacity(2 * strings.len());
+        for (mut mask, coeff) in strings {
+            let (x, z) = mask.split_at_mut(num_words);
+            let coeff = if z[word] & bit == 0 {
+                0.5 * coeff
+            } else {
+                -0.5 * coeff
+            };
+            x[word] ^= bit;
+            z[..word].iter_mut().for_each(|w| *w = !*w);
+            z[word] ^= bit - 1;
+            let mut flipped = mask.clone();
+            flipped[num_words + word] ^= bit;
+            expanded.push((mask, coeff));
+            expanded.push((flipped, if *action { coeff } else { -coeff }));
+        }
+        strings = expanded;
+    }
+    strings
+}
 
-fn map_action(action: FermionAction, num_qubits: u32) -> *mut qiskit_sys::QkObs {
-    let fer_idx = *action.1 as usize;
-    let im = if *action.0 { -0.5 } else { 0.5 };
-    let mut coeffs: Vec<qiskit_sys::QkComplex64> = vec![
-        qiskit_sys::QkComplex64 { re: 0.5, im: 0.0 },
-        qiskit_sys::QkComplex64 { re: 0.0, im },
-    ];
+pub fn jordan_wigner(fer_op: &FermionOperator, num_qubits: u32) -> *mut qiskit_sys::QkObs {
+    let num_words = (num_qubits as usize).div_ceil(WORD_BITS);
+
+    #[cfg(feature = "rayon")]
+    let expanded: Vec<_> = {
+        let terms: Vec<_> = fer_op.iter().collect();
+        // NOTE: the terms are distributed in roughly eight chunks per thread, which balances
+        // the (very uneven) cost of expanding terms of different lengths while avoiding the
+        // overhead of a separate task and result vector for every single term.
+        let chunk_size = terms
+            .len()
+            .div_ceil(8 * rayon::current_num_threads())
+            .max(1);
+        terms
+            .par_chunks(chunk_size)
+            .flat_map_iter(|chunk| chunk.iter().flat_map(|term| expand_term(*term, num_words)))
+            .collect()
+    };
+    #[cfg(not(feature = "rayon"))]
+    let expanded: Vec<_> = fer_op
+        .iter()
+        .flat_map(|term| expand_term(term, num_words))
+        .collect();
+
+    // NOTE: the Pauli strings are collected in order of their first occurrence, which keeps the
+    // output deterministic even when the terms get expanded in parallel.
+    let mut positions = HashMap::<PauliMask, usize>::new();
+    let mut masks = Vec::<PauliMask>::new();
+    let mut pauli_coeffs = Vec::<Complex64>::new();
+    for (mask, coeff) in expanded {
+        let pos = *positions.entry(mask).or_insert_with_key(|mask| {
+            masks.push(mask.clone());
+            pauli_coeffs.push(Complex64::zero());
+            pauli_coeffs.len() - 1
+        });
+        pauli_coeffs[pos] += coeff;
+    }
 
+    let mut coeffs = Vec::<qiskit_sys::QkComplex64>::with_capacity(masks.len());
     let mut bit_terms = Vec::<qiskit_sys::QkBitTerm>::new();
     let mut indices = Vec::<u32>::new();
-    for qb_idx in 0..fer_idx {
-        bit_terms.push(qiskit_sys::QkBitTerm_QkBitTerm_Z);
-        indices.push(qb_idx as u32);
-    }
-    bit_terms.push(qiskit_sys::QkBitTerm_QkBitTerm_X);
-    indices.push(fer_idx as u32);
-    for qb_idx in 0..fer_idx {
-        bit_terms.push(qiskit_sys::QkBitTerm_QkBitTerm_Z);
-        indices.push(qb_idx as u32);
+    let mut boundaries = vec![0];
+    for (mask, coeff) in masks.iter().zip(pauli_coeffs) {
+        let (x, z) = mask.split_at(num_words);
+        // every `XZ` pair on the same qubit equals `-iY`
+        let num_y: u32 = x.iter().zip(z).map(|(x, z)| (x & z).count_ones()).sum();
+        let coeff = match num_y % 4 {
+            0 => coeff,
+            1 => Complex64::new(coeff.im, -coeff.re),
+            2 => -coeff,
+            _ => Complex64::new(-coeff.im, coeff.re),
+        };
+        if coeff.norm() <= 1e-18 {
+            continue;
+        }
+        coeffs.push(qiskit_sys::QkComplex64 {
+            re: coeff.re,
+            im: coeff.im,
+        });
+        for (word, (x, z)) in x.iter().zip(z).enumerate() {
+            let mut support = x | z;
+            while support != 0 {
+                let bit = support.trailing_zeros();
+                bit_terms.push(match ((x >> bit) & 1, (z >> bit) & 1) {
+                    (1, 0) => qiskit_sys::QkBitTerm_QkBitTerm_X,
+                    (0, 1) => qiskit_sys::QkBitTerm_QkBitTerm_Z,
+                    _ => qiskit_sys::QkBitTerm_QkBitTerm_Y,
+                });
+                indices.push((word * WORD_BITS) as u32 + bit);
+                support &= support - 1;
+            }
+        }
+        boundaries.push(indices.len());
     }
-    bit_terms.push(qiskit_sys::QkBitTerm_QkBitTerm_Y);
-    indices.push(fer_idx as u32);
-
-    let mut boundaries: Vec<usize> = vec![0, fer_idx + 1, 2 * fer_idx + 2];
 
     unsafe {
         qiskit_sys::qk_obs_new(
@@ -53,124 +144,6 @@ fn map_action(action: FermionAction, num_qubits: u32) -> *mut qiskit_sys::QkObs
     }
 }
 
-// NOTE: https://stackoverflow.com/a/50341075
-struct Wrapper {
-    ptr: *mut qiskit_sys::QkObs,
-}
-unsafe impl Send for Wrapper {}
-
-// TODO: can we clean up the coding pattern of overwriting a data structure in-place to avoid the
-// repetitive re-allocations?
-pub fn jordan_wigner(fer_op: &FermionOperator, num_qubits: u32) -> *mut qiskit_sys::QkObs {
-    let pool = rayon::ThreadPoolBuilder::new()
-        .num_threads(0)
-        .build()
-        .unwrap();
-
-    let mut qubit_ops = vec![];
-    for _ in 0..pool.current_num_threads() {
-        qubit_ops.push(Arc::new(Mutex::new(Wrapper {
-            ptr: unsafe { qiskit_sys::qk_obs_zero(num_qubits) },
-        })));
-    }
-
-    pool.install(|| {
-        fer_op.iter().par_bridge().for_each(|term| {
-            let qk_coeff = qiskit_sys::QkComplex64 {
-                re: term.coeff.re,
-                im: term.coeff.im,
-            };
-
-            let mut mapped_term = unsafe { qiskit_sys::qk_obs_identity(num_qubits) };
-
-            term.iter().for_each(|action| {
-                let mapped_action = map_action(action, num_qubits);
-                let new_term = unsafe { qiskit_sys::qk_obs_compose(mapped_action, mapped_term) };
-                unsafe { qiskit_sys::qk_obs_free(mapped_action) };
-                unsafe { qiskit_sys::qk_obs_free(mapped_term) };
-                mapped_term = new_term;
-            });
-
-            let scaled_term = unsafe { qiskit_sys::qk_obs_multiply(mapped_term, &qk_coeff) };
-            unsafe { qiskit_sys::qk_obs_free(mapped_term) };
-
-            let canon_term = unsafe { qiskit_sys::qk_obs_canonicalize(scaled_term, 1e-18) };
-            unsafe { qiskit_sys::qk_obs_free(scaled_term) };
-
-            let qubit_op = qubit_ops[pool.current_thread_index().unwrap()]
-                // this should never lock because we have one item per thread
-                .lock()
-                .unwrap();
-
-            // PERF: we are addinf the terms one-by-one manually since this is significantly more
-            // efficient that many repetitive calls to qk_obs_add. In-place addition support within
-            // Qiskit would alleviate the need for this.
-            let num_add_terms = unsafe { qiskit_sys::qk_obs_num_terms(canon_term) };
-            let mut term = MaybeUninit::uninit();
-            (0..num_add_terms).for_each(|j| unsafe {
-                qiskit_sys::qk_obs_term(canon_term, j as u64, term.as_mut_ptr());
-                qiskit_sys::qk_obs_add_term(qubit_op.ptr, term.as_ptr());
-            });
-
-            unsafe { qiskit_sys::qk_obs_free(canon_term) };
-        });
-    });
-
-    let mapped_operator: Wrapper = qubit_ops
-        .par_iter()
-        .fold(
-            || Wrapper {
-                ptr: unsafe { qiskit_sys::qk_obs_zero(num_qubits) },
-            },
-            {
-                |op1: Wrapper, op2| {
-                    let op_locked = op2.lock().unwrap();
-
-                    let num_add_terms = unsafe { qiskit_sys::qk_obs_num_terms(op_locked.ptr) };
-                    let mut term = MaybeUninit::uninit();
-                    (0..num_add_terms).for_each(|j| unsafe {
-                        qiskit_sys::qk_obs_term(op_locked.ptr, j as u64, term.as_mut_ptr());
-                        qiskit_sys::qk_obs_add_term(op1.ptr, term.as_ptr());
-                    });
-
-                    unsafe { qiskit_sys::qk_obs_free(op_locked.ptr) };
-
-                    op1
-                }
-            },
-        )
-        .reduce(
-            || Wrapper {
-                ptr: unsafe { qiskit_sys::qk_obs_zero(num_qubits) },
-            },
-            {
-                |op1, op2| {
-                    let num_add_terms1 = unsafe { qiskit_sys::qk_obs_num_terms(op1.ptr) };
-                    let num_add_terms2 = unsafe { qiskit_sys::qk_obs_num_terms(op2.ptr) };
-                    if num_add_terms1 > num_add_terms2 {
-                        let mut term = MaybeUninit::uninit();
-                        (0..num_add_terms2).for_each(|j| unsafe {
-                            qiskit_sys::qk_obs_term(op2.ptr, j as u64, term.as_mut_ptr());
-                            qiskit_sys::qk_obs_add_term(op1.ptr, term.as_ptr());
-                        });
-                        unsafe { qiskit_sys::qk_obs_free(op2.ptr) };
-                        op1
-                    } else {
-                        let mut term = MaybeUninit::uninit();
-                        (0..num_add_terms1).for_each(|j| unsafe {
-                            qiskit_sys::qk_obs_term(op1.ptr, j as u64, term.as_mut_ptr());
-                            qiskit_sys::qk_obs_add_term(op2.ptr, term.as_ptr());
-                        });
-                        unsafe { qiskit_sys::qk_obs_free(op1.ptr) };
-                        op2
-                    }
-                }
-            },
-        );
-
-    mapped_operator.ptr
-}
-
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -14,6 +14,8 @@ use crate::operators::{OperatorMacro, OperatorTrait};
 use num_complex::{Complex64, ComplexFloat};
 use std::cmp::Ordering;
 use std::collections::HashMap;
+use std::collections::hash_map::Entry;
+use std::hash::Hash;
 use std::iter::zip;
 use std::ops::{
     Add, AddAssign, BitAnd, BitAndAssign, Div, DivAssign, Mul, MulAssign, Neg, Sub, SubAssign,
@@ -56,21 +58,65 @@ crate::impl_operator_macro!(FermionOperator);
 
 impl FermionOperator {
     pub fn simplify(&self, atol: f64) -> Self {
-        let mut terms = HashMap::new();
-        for term in self.iter() {
-            terms
-                .entry((term.indices, term.actions))
-                .and_modify(|c| *c += term.coeff)
-                .or_insert(term.coeff);
+        // NOTE: every term gets keyed by its packed actions, such that the terms are hashed and
+        // compared as plain integers rather than as a pair of separate index and action slices.
+        //
+        // If all terms fit, each term is packed into a single 128-bit integer. Every action
+        // occupies a fixed-width lane storing `((index << 1) | action) + 1`, which is never zero,
+        // such that terms of different lengths cannot collide. Otherwise, every term is keyed by a
+        // slice of its actions packed into 64-bit integers.
+        let max_lane = self
+            .indices
+            .iter()
+            .max()
+            .map_or(1, |index| ((*index as u64) << 1) + 2);
+        let width = u64::BITS - max_lane.leading_zeros();
+        if self.many_body_order() <= u128::BITS / width {
+            let keys = self.boundaries.windows(2).map(|bounds| {
+                zip(
+                    &self.actions[bounds[0]..bounds[1]],
+                    &self.indices[bounds[0]..bounds[1]],
+                )
+                .fold(0u128, |key, (action, index)| {
+                    (key << width) | ((((*index as u128) << 1) | *action as u128) + 1)
+                })
+            });
+            return self._simplify_by_keys(keys, atol);
+        }
+        let packed: Vec<u64> = zip(&self.actions, &self.indices)
+            .map(|(action, index)| ((*index as u64) << 1) | *action as u64)
+            .collect();
+        let keys = self
+            .boundaries
+            .windows(2)
+            .map(|bounds| &packed[bounds[0]..bounds[1]]);
+        self._simplify_by_keys(keys, atol)
+    }
+
+    fn _simplify_by_keys<K: Eq + Hash>(&self, keys: impl Iterator<Item = K>, atol: f64) -> Self {
+        // NOTE: equal terms are summed into the position of their first occurrence. This keeps the
+        // output order deterministic and allows the tolerance to be applied in a single pass over
+        // the unique terms rather than iterating the hash map.
+        let mut positions = HashMap::with_capacity(self.coeffs.len());
+        let mut terms = Vec::with_capacity(self.coeffs.len());
+        let mut coeffs = Vec::<Complex64>::with_capacity(self.coeffs.len());
+        for (term, key) in zip(self.iter(), keys) {
+            match positions.entry(key) {
+                Entry::Occupied(entry) => coeffs[*entry.get()] += term.coeff,
+                Entry::Vacant(entry) => {
+                    entry.insert(terms.len());
+                    terms.push(term);
+                    coeffs.push(term.coeff);
+                }
+            }
         }
         let mut out = Self::zero();
-        terms
-            .iter()
-            .filter(|((_, _), coeff)| coeff.abs() > atol)
-            .for_each(|((indices, actions), coeff)| {
-                out.coeffs.push(*coeff);
-                out.actions.extend_from_slice(actions);
-                out.indices.extend_from_slice(indices);
+        zip(terms, coeffs)
+            .filter(|(_, coeff)| coeff.abs() > atol)
+            .for_each(|(term, coeff)| {
+                out.coeffs.push(coeff);
+                out.actions.extend_from_slice(term.actions);
+                out.indices.extend_from_slice(term.indices);
                 out.boundaries.push(out.indices.len());
             });
         out
@@ -89,56 +135,135 @@ impl FermionOperator {
     }
 
     pub fn normal_ordered(&self) -> Self {
+        self._normal_ordered(None)
+    }
+
+    /// Returns the normal-ordered operator without any terms whose coefficient magnitude does not
+    /// exceed `atol`.
+    ///
+    /// This is equivalent to calling [`Self::normal_ordered`] followed by [`OperatorTrait::ichop`]
+    /// but skips the chopped terms while normal ordering rather than copying the remaining ones
+    /// afterwards.
+    pub fn normal_ordered_chopped(&self, atol: f64) -> Self {
+        self._normal_ordered(Some(atol))
+    }
+
+    fn _normal_ordered(&self, atol: Option<f64>) -> Self {
         let mut result = Self::zero();
         self.iter()
-            .for_each(|term| result.__iadd__(&_normal_ordered_term(term)));
+            .for_each(|term| _normal_ordered_term(term, atol, &mut result));
         result
     }
 
     pub fn is_hermitian(&self, atol: f64) -> bool {
-        let mut diff = (self.__sub__(&self.adjoint())).normal_ordered();
-        diff.ichop(atol);
-        diff.equiv(&Self::zero(), atol)
+        // NOTE: the difference is built in-place from the adjoint and, once normal-ordered, gets
+        // simplified directly. Comparing it against a zero operator via `equiv` would subtract and
+        // copy it once more. The operator is Hermitian if no terms survive the simplification.
+        let mut diff = self.adjoint();
+        diff.__imul__(Complex64::new(-1.0, 0.0));
+        diff.__iadd__(self);
+        diff.normal_ordered_chopped(atol)
+            .simplify(atol)
+            .coeffs
+            .is_empty()
     }
 
     pub fn many_body_order(&self) -> u32 {
-        let mut max = 0;
-        let mut prev_b = 0;
-        // TODO: refactor this
-        self.boundaries[1..].iter().for_each(|b| {
-            let d = b - prev_b;
-            if d > max {
-                max = d;
-            }
-            prev_b = *b;
-        });
-        max as u32
+        self.boundaries
+            .windows(2)
+            .map(|bounds| bounds[1] - bounds[0])
+            .max()
+            .unwrap_or(0) as u32
+    }
+
+    /// Returns the actions of this operator packed into single integers.
+    ///
+    /// Each entry stores `(index << 1) | action`, such that the lowest bit indicates a creation
+    /// (`1`) or annihilation (`0`) action and the remaining bits store the mode index. The entries
+    /// are 64-bit integers, such that every 32-bit mode index fits without overflowing.
+    pub fn packed_actions(&self) -> Vec<u64> {
+        zip(&self.actions, &self.indices)
+            .map(|(action, index)| ((*index as u64) << 1) | *action as u64)
+            .collect()
     }
 
     pub fn conserves_particle_number(&self) -> bool {
+        // NOTE: a term conserves the particle number if exactly half of its actions are creations,
+        // which only requires counting them within each term's slice.
+        self.boundaries.windows(2).all(|bounds| {
+            let num_creations = self.actions[bounds[0]..bounds[1]]
+                .iter()
+                .filter(|action| **action)
+                .count();
+            2 * num_creations == bounds[1] - bounds[0]
+        })
+    }
+
+    /// Splits the operator into groups of terms which act on the same set of modes.
+    ///
+    /// Each group is returned alongside its support, i.e. the sorted and deduplicated indices of
+    /// the modes which its terms act upon. Within every group, the indices get relabeled by their
+    /// position in the support, such that each group acts on the modes `0..support.len()` only.
+    /// The groups are ordered by the first occurrence of their support.
+    pub fn split_by_support(&self) -> Vec<(Vec<u32>, Self)> {
+        let mut positions: HashMap<Vec<u32>, usize> = HashMap::new();
+        let mut groups: Vec<(Vec<u32>, Self)> = Vec::new();
+        let mut support = Vec::new();
         for term in self.iter() {
-            let (create_count, destroy_count) =
-                term.iter()
-                    .fold((0, 0), |(create_acc, destroy_acc), (action, _)| {
-                        if *action {
-                            (create_acc + 1, destroy_acc)
-                        } else {
-                            (create_acc, destroy_acc + 1)
-                        }
-                    });
-            if create_count != destroy_count {
-                return false;
-            }
+            support.clear();
+            support.extend_from_slice(term.indices);
+            support.sort_unstable();
+            support.dedup();
+            let group = match positions.get(support.as_slice()) {
+                Some(&position) => &mut groups[position].1,
+                None => {
+                    positions.insert(support.clone(), groups.len());
+                    groups.push((support.clone(), Self::zero()));
+                    &mut groups.last_mut().unwrap().1
+                }
+            };
+            group.coeffs.push(term.coeff);
+            group.actions.extend_from_slice(term.actions);
+            group.indices.extend(
+                term.indices
+                    .iter()
+                    .map(|index| support.binary_search(index).unwrap() as u32),
+            );
+            group.boundaries.push(group.indices.len());
         }
-        true
+        groups
     }
 }
 
-fn _normal_ordered_term(term_view: FermionOperatorTermView) -> FermionOperator {
-    let mut coeffs = vec![];
-    let mut actions = vec![];
-    let mut indices = vec![];
-    let mut boundaries = vec![0];
+/// Returns the sort key of an action in normal order.
+///
+/// The action is packed into the bit above the 32-bit mode index, such that creation actions sort
+/// before annihilation actions when ordering the keys in descending order.
+#[inline]
+fn _normal_order_key((action, index): FermionAction) -> u64 {
+    ((*action as u64) << u32::BITS) | *index as u64
+}
+
+fn _normal_ordered_term(
+    term_view: FermionOperatorTermView,
+    atol: Option<f64>,
+    out: &mut FermionOperator,
+) {
+    // NOTE: a term whose keys strictly descend is already in normal order (and contains no
+    // repeated actions), so it can be copied over without going through the reordering below.
+    if term_view
+        .iter()
+        .map(_normal_order_key)
+        .is_sorted_by(|left, right| left > right)
+    {
+        if atol.is_none_or(|atol| term_view.coeff.abs() > atol) {
+            out.coeffs.push(term_view.coeff);
+            out.actions.extend_from_slice(term_view.actions);
+            out.indices.extend_from_slice(term_view.indices);
+            out.boundaries.push(out.indices.len());
+        }
+        return;
+    }
 
     let mut stack = vec![(term_view.to_vec(), term_view.coeff)];
     while let Some((mut term, coeff)) = stack.pop() {
@@ -180,22 +305,16 @@ fn _normal_ordered_term(term_view: FermionOperatorTermView) -> FermionOperator {
                 }
             }
         }
-        if zero {
+        let signed_coeff = if parity { -coeff } else { coeff };
+        if zero || atol.is_some_and(|atol| signed_coeff.abs() <= atol) {
             continue;
         }
-        let signed_coeff = if parity { -coeff } else { coeff };
-        coeffs.push(signed_coeff);
+        out.coeffs.push(signed_coeff);
         term.iter().for_each(|&(&a, &i)| {
-            actions.push(a);
-            indices.push(i);
+            out.actions.push(a);
+            out.indices.push(i);
         });
-        boundaries.push(indices.len())
-    }
-    FermionOperator {
-        coeffs,
-        actions,
-        indices,
-        boundaries,
+        out.boundaries.push(out.indices.len())
     }
 }
 
@@ -219,33 +338,22 @@ impl OperatorTrait for FermionOperator {
     }
 
     fn equiv(&self, other: &Self, atol: f64) -> bool {
-        let mut diff = self.__sub__(other);
-        diff = diff.simplify(atol);
-        for c in diff.coeffs {
-            if c.abs() > atol {
-                return false;
-            }
-        }
-        true
+        // NOTE: simplifying the difference already drops all terms whose coefficient magnitude does
+        // not exceed `atol`. Thus, both operators are equivalent if no terms survive it.
+        self.__sub__(other).simplify(atol).coeffs.is_empty()
     }
 
     fn adjoint(&self) -> Self {
-        let mut coeffs = vec![];
-        let mut actions = vec![];
-        let mut indices = vec![];
-
-        self.iter().for_each(|term| {
-            coeffs.push(term.coeff.conj());
-            actions.extend(term.actions.iter().rev().map(|a| !a));
-            indices.extend(term.indices.iter().rev());
+        // NOTE: the buffers are copied in bulk and then transformed in-place, reversing the actions
+        // of each term within its own slice. The boundaries remain unchanged.
+        let mut adjoint = self.clone();
+        adjoint.coeffs.iter_mut().for_each(|c| *c = c.conj());
+        adjoint.actions.iter_mut().for_each(|a| *a = !*a);
+        self.boundaries.windows(2).for_each(|bounds| {
+            adjoint.actions[bounds[0]..bounds[1]].reverse();
+            adjoint.indices[bounds[0]..bounds[1]].reverse();
         });
-
-        Self {
-            coeffs,
-            actions,
-            indices,
-            boundaries: self.boundaries.to_vec(),
-        }
+        adjoint
     }
 
     fn __iadd__(&mut self, other: &Self) {
@@ -285,24 +393,27 @@ impl OperatorTrait for FermionOperator {
     }
 
     fn ichop(&mut self, atol: f64) {
-        let mut coeffs = vec![];
-        let mut actions = vec![];
-        let mut indices = vec![];
-        let mut boundaries = vec![0];
-
-        self.iter()
-            .filter(|term| term.coeff.abs() > atol)
-            .for_each(|term| {
-                coeffs.push(term.coeff.conj());
-                actions.extend_from_slice(term.actions);
-                indices.extend_from_slice(term.indices);
-                boundaries.push(indices.len());
-            });
-
-        self.coeffs = coeffs;
-        self.actions = actions;
-        self.indices = indices;
-        self.boundaries = boundaries;
+        // NOTE: the retained terms get compacted in-place by moving them forward within the
+        // existing buffers, rather than copying them into newly allocated ones.
+        let mut num_terms = 0;
+        let mut num_actions = 0;
+        for i in 0..self.coeffs.len() {
+            let coeff = self.coeffs[i];
+            if coeff.abs() <= atol {
+                continue;
+            }
+            let (start, end) = (self.boundaries[i], self.boundaries[i + 1]);
+            self.actions.copy_within(start..end, num_actions);
+            self.indices.copy_within(start..end, num_actions);
+            num_actions += end - start;
+            self.coeffs[num_terms] = coeff;
+            num_terms += 1;
+            self.boundaries[num_terms] = num_actions;
+        }
+        self.coeffs.truncate(num_terms);
+        self.actions.truncate(num_actions);
+        self.indices.truncate(num_actions);
+        self.boundaries.truncate(num_terms + 1);
     }
 }
 
@@ -667,6 +778,44 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_simplify() {
+        let op = FermionOperator {
+            coeffs: vec![
+                Complex64::new(1.0, 0.0),
+                Complex64::new(2.0, 0.0),
+                Complex64::new(3.0, 0.0),
+                Complex64::new(4.0, 0.0),
+                Complex64::new(-3.0, 0.0),
+            ],
+            actions: vec![false, true, false, false, true, false],
+            indices: vec![0, 0, 0, 0, 0, 0],
+            boundaries: vec![0, 0, 1, 3, 4, 6],
+        };
+        let expected = FermionOperator {
+            coeffs: vec![Complex64::new(1.0, 0.0), Complex64::new(6.0, 0.0)],
+            actions: vec![false],
+            indices: vec![0],
+            boundaries: vec![0, 0, 1],
+        };
+        assert_eq!(op.simplify(1e-8), expected);
+
+        // terms which do not fit into a single 128-bit key
+        let op = FermionOperator {
+            coeffs: vec![Complex64::new(1.0, 0.0), Complex64::new(2.0, 0.0)],
+            actions: vec![true, true, false, false, true, true, false, false],
+            indices: vec![u32::MAX, 1, 2, 3, u32::MAX, 1, 2, 3],
+            boundaries: vec![0, 4, 8],
+        };
+        let expected = FermionOperator {
+            coeffs: vec![Complex64::new(3.0, 0.0)],
+            actions: vec![true, true, false, false],
+            indices: vec![u32::MAX, 1, 2, 3],
+            boundaries: vec![0, 4],
+        };
+        assert_eq!(op.simplify(1e-8), expected);
+    }
+
     #[test]
     fn test_equiv() {
         let zero = FermionOperator::zero();
@@ -764,6 +913,77 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_packed_actions() {
+        let op = FermionOperator {
+            coeffs: vec![Complex64::new(1.0, 0.0), Complex64::new(2.0, 0.0)],
+            actions: vec![true, false, false],
+            indices: vec![0, 1, 3],
+            boundaries: vec![0, 2, 3],
+        };
+
+        assert_eq!(op.packed_actions(), vec![1, 2, 6]);
+
+        let op = FermionOperator {
+            coeffs: vec![Complex64::new(1.0, 0.0)],
+            actions: vec![true],
+            indices: vec![u32::MAX],
+            boundaries: vec![0, 1],
+        };
+
+        assert_eq!(op.packed_actions(), vec![((u32::MAX as u64) << 1) | 1]);
+    }
+
+    #[test]
+    fn test_split_by_support() {
+        let op = FermionOperator {
+            coeffs: vec![
+                Complex64::new(1.0, 0.0),
+                Complex64::new(2.0, 0.0),
+                Complex64::new(3.0, 0.0),
+                Complex64::new(4.0, 0.0),
+                Complex64::new(5.0, 0.0),
+            ],
+            actions: vec![true, false, true, false, true, false, true, false],
+            indices: vec![3, 1, 2, 2, 1, 3, 1, 1],
+            boundaries: vec![0, 0, 2, 4, 6, 8],
+        };
+        let groups = op.split_by_support();
+        assert_eq!(
+            groups,
+            vec![
+                (vec![], FermionOperator::one()),
+                (
+                    vec![1, 3],
+                    FermionOperator {
+                        coeffs: vec![Complex64::new(2.0, 0.0), Complex64::new(4.0, 0.0)],
+                        actions: vec![true, false, true, false],
+                        indices: vec![1, 0, 0, 1],
+                        boundaries: vec![0, 2, 4],
+                    }
+                ),
+                (
+                    vec![2],
+                    FermionOperator {
+                        coeffs: vec![Complex64::new(3.0, 0.0)],
+                        actions: vec![true, false],
+                        indices: vec![0, 0],
+                        boundaries: vec![0, 2],
+                    }
+                ),
+                (
+                    vec![1],
+                    FermionOperator {
+                        coeffs: vec![Complex64::new(5.0, 0.0)],
+                        actions: vec![true, false],
+                        indices: vec![0, 0],
+                        boundaries: vec![0, 2],
+                    }
+                ),
+            ]
+        );
+    }
+
     #[test]
     fn test_conserves_particle_number() {
         let op1 = FermionOperator {
@@ -10,7 +10,7 @@
 // copyright notice, and modified files need to carry a notice indicating
 // that they have been altered from the originals.
 
-use crate::operators::OperatorMacro;
+use crate::operators::{OperatorMacro, OperatorTrait};
 use num_complex::Complex64;
 
 // PERF: we should be able to improve the efficiency of all three functions below by writing one
@@ -22,26 +22,41 @@ use num_complex::Complex64;
 
 pub fn commutator<T>(op_a: &T, op_b: &T) -> T
 where
-    T: OperatorMacro,
+    T: OperatorTrait + OperatorMacro,
 {
-    op_a.__and__(op_b).__sub__(&op_b.__and__(op_a))
+    let mut comm = op_a.__and__(op_b);
+    comm.__isub__(&op_b.__and__(op_a));
+    comm
 }
 
 pub fn anti_commutator<T>(op_a: &T, op_b: &T) -> T
 where
-    T: OperatorMacro,
+    T: OperatorTrait + OperatorMacro,
 {
-    op_a.__and__(op_b).__add__(&op_b.__and__(op_a))
+    let mut comm = op_a.__and__(op_b);
+    comm.__iadd__(&op_b.__and__(op_a));
+    comm
 }
 
 pub fn double_commutator<T>(op_a: &T, op_b: &T, op_c: &T, sign: bool) -> T
 where
-    T: OperatorMacro,
+    T: OperatorTrait + OperatorMacro,
 {
-    let sign_num = if sign {
-        Complex64::new(1.0, 0.0)
-    } else {
-        Complex64::new(-1.0, 0.0)
+    // NOTE: rather than scaling the signed products by +/-1, the sign selects whether they get
+    // added or subtracted in-place, which avoids copying each of them once more.
+    let add_signed = |out: &mut T, op: &T| {
+        if sign {
+            out.__iadd__(op)
+        } else {
+            out.__isub__(op)
+        }
+    };
+    let sub_signed = |out: &mut T, op: &T| {
+        if sign {
+            out.__isub__(op)
+        } else {
+            out.__iadd__(op)
+        }
     };
 
     let op_ab = op_a.__and__(op_b);
@@ -49,25 +64,23 @@ where
     let op_ac = op_a.__and__(op_c);
     let op_ca = op_c.__and__(op_a);
 
-    let op_abc = op_ab.__and__(op_c);
-    let op_cab = op_c.__and__(&op_ab);
-    let op_bac = op_ba.__and__(op_c);
-    let op_cba = op_c.__and__(&op_ba);
-    let op_acb = op_ac.__and__(op_b);
-    let op_bca = op_b.__and__(&op_ca);
+    let mut result = op_ab.__and__(op_c);
+    sub_signed(&mut result, &op_c.__and__(&op_ba));
 
-    let term1 = op_abc.__sub__(&op_cba.__mul__(sign_num));
-    let term2 = op_bac.__neg__().__add__(&op_cab.__mul__(sign_num));
-    let term3 = op_acb.__add__(&op_bca.__mul__(sign_num));
-    let diff = term2.__sub__(&term3);
+    let mut diff = op_ba.__and__(op_c);
+    diff.__imul__(Complex64::new(-1.0, 0.0));
+    add_signed(&mut diff, &op_c.__and__(&op_ab));
+    diff.__isub__(&op_ac.__and__(op_b));
+    sub_signed(&mut diff, &op_b.__and__(&op_ca));
+    diff.__imul__(Complex64::new(0.5, 0.0));
 
-    term1.__add__(&diff.__mul__(Complex64::new(0.5, 0.0)))
+    result.__iadd__(&diff);
+    result
 }
 
 #[cfg(test)]
 mod tests {
     use super::*;
-    use crate::operators::OperatorTrait;
     use crate::operators::fermion_operator::FermionOperator;
 
     #[test]
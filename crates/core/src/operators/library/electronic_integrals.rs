@@ -14,65 +14,87 @@ use crate::operators::OperatorTrait;
 use crate::operators::fermion_operator::FermionOperator;
 use ndarray::ArrayView1;
 use num_complex::Complex64;
+#[cfg(feature = "rayon")]
+use rayon::prelude::*;
+
+/// The number of nonzero integrals which get expanded into terms by a single parallel task.
+#[cfg(feature = "rayon")]
+const PARALLEL_CHUNK_SIZE: usize = 1 << 12;
 
 fn _inflate_index(index: u32) -> (u32, u32) {
-    let mut p = 0;
+    // NOTE: this inverts `index = p * (p + 1) / 2 + q` in closed form. The loops only correct for
+    // the rounding of the floating point square root and run at most once.
+    let index = index as u64;
+    let mut p = ((((8 * index + 1) as f64).sqrt() - 1.0) / 2.0) as u64;
+    while p * (p + 1) / 2 > index {
+        p -= 1;
+    }
     while (p + 1) * (p + 2) / 2 <= index {
         p += 1;
     }
     let q = index - p * (p + 1) / 2;
-    (p, q)
+    (p as u32, q as u32)
 }
 
-fn _expand_s4_index(iajb: u32, npair: u32) -> Vec<(u32, u32, u32, u32)> {
-    let ia = iajb / npair;
-    let jb = iajb % npair;
-
-    let (i, a) = _inflate_index(ia);
-    let (j, b) = _inflate_index(jb);
-
-    let mut res = vec![(i, a, j, b)];
+#[inline]
+fn _for_each_pair_swap(i: u32, a: u32, j: u32, b: u32, f: &mut impl FnMut(u32, u32, u32, u32)) {
+    f(i, a, j, b);
     if i > a {
-        res.push((a, i, j, b));
+        f(a, i, j, b);
     }
     if j > b {
-        res.push((i, a, b, j));
+        f(i, a, b, j);
     }
     if i > a && j > b {
-        res.push((a, i, b, j));
+        f(a, i, b, j);
     }
-    res
 }
 
-fn _expand_s8_index(iajb: u32) -> Vec<(u32, u32, u32, u32)> {
-    let (ia, jb) = _inflate_index(iajb);
-    let (mut i, mut a) = _inflate_index(ia);
-    let (mut j, mut b) = _inflate_index(jb);
+fn _for_each_s4_index(iajb: u32, npair: u32, mut f: impl FnMut(u32, u32, u32, u32)) {
+    let (i, a) = _inflate_index(iajb / npair);
+    let (j, b) = _inflate_index(iajb % npair);
+    _for_each_pair_swap(i, a, j, b, &mut f);
+}
 
-    let mut res = vec![(i, a, j, b)];
-    if i > a {
-        res.push((a, i, j, b));
-    }
-    if j > b {
-        res.push((i, a, b, j));
-    }
-    if i > a && j > b {
-        res.push((a, i, b, j));
-    }
+fn _for_each_s8_index(iajb: u32, mut f: impl FnMut(u32, u32, u32, u32)) {
+    let (ia, jb) = _inflate_index(iajb);
+    let (i, a) = _inflate_index(ia);
+    let (j, b) = _inflate_index(jb);
+    _for_each_pair_swap(i, a, j, b, &mut f);
     if ia > jb {
-        (i, a, j, b) = (j, b, i, a);
-        res.push((i, a, j, b));
-        if i > a {
-            res.push((a, i, j, b));
-        }
-        if j > b {
-            res.push((i, a, b, j));
-        }
-        if i > a && j > b {
-            res.push((a, i, b, j));
-        }
+        _for_each_pair_swap(j, b, i, a, &mut f);
     }
-    res
+}
+
+fn _nonzero_entries<'a>(values: ArrayView1<'a, f64>) -> impl Iterator<Item = (u32, f64)> + 'a {
+    values
+        .into_iter()
+        .enumerate()
+        .filter(|&(_, coeff)| coeff.abs() > 0.0)
+        .map(|(idx, &coeff)| (idx as u32, coeff))
+}
+
+fn _count_1body_terms(one_body: ArrayView1<f64>) -> usize {
+    _nonzero_entries(one_body)
+        .map(|(ia, _)| {
+            let (i, a) = _inflate_index(ia);
+            if i == a { 1 } else { 2 }
+        })
+        .sum()
+}
+
+fn _count_s4_terms(two_body: ArrayView1<f64>, npair: u32) -> usize {
+    let mut count = 0;
+    _nonzero_entries(two_body)
+        .for_each(|(iajb, _)| _for_each_s4_index(iajb, npair, |_, _, _, _| count += 1));
+    count
+}
+
+fn _count_s8_terms(two_body: ArrayView1<f64>) -> usize {
+    let mut count = 0;
+    _nonzero_entries(two_body)
+        .for_each(|(iajb, _)| _for_each_s8_index(iajb, |_, _, _, _| count += 1));
+    count
 }
 
 pub trait From1Body {
@@ -99,6 +121,41 @@ pub trait From1Body {
 }
 
 impl FermionOperator {
+    #[inline]
+    fn _reserve_terms(op: &mut Self, num_terms: usize, num_actions: usize) {
+        op.coeffs.reserve(num_terms);
+        op.actions.reserve(num_terms * num_actions);
+        op.indices.reserve(num_terms * num_actions);
+        op.boundaries.reserve(num_terms);
+    }
+
+    /// Calls `insert` for every nonzero entry of `values` to append the generated terms to `op`.
+    ///
+    /// With the `rayon` feature, the entries are processed in parallel chunks. The terms of every
+    /// chunk are appended in order, such that the result does not depend on the number of threads.
+    fn _extend_nonzero<F>(op: &mut Self, values: ArrayView1<f64>, insert: F)
+    where
+        F: Fn(&mut Self, u32, f64) + Sync,
+    {
+        #[cfg(feature = "rayon")]
+        {
+            let entries: Vec<_> = _nonzero_entries(values).collect();
+            let chunks: Vec<_> = entries
+                .par_chunks(PARALLEL_CHUNK_SIZE)
+                .map(|chunk| {
+                    let mut part = Self::zero();
+                    chunk
+                        .iter()
+                        .for_each(|&(idx, coeff)| insert(&mut part, idx, coeff));
+                    part
+                })
+                .collect();
+            chunks.iter().for_each(|part| op.__iadd__(part));
+        }
+        #[cfg(not(feature = "rayon"))]
+        _nonzero_entries(values).for_each(|(idx, coeff)| insert(op, idx, coeff));
+    }
+
     #[inline]
     fn _insert_1body_idx(op: &mut Self, c: Complex64, i: u32, a: u32) {
         op.coeffs.push(c);
@@ -134,15 +191,13 @@ impl FermionOperator {
 
 impl From1Body for FermionOperator {
     fn add_1body_tril_spin_sym(&mut self, one_body_a: ArrayView1<f64>, norb: u32) {
-        one_body_a
-            .indexed_iter()
-            .filter(|&(_, coeff)| coeff.abs() > 0.0)
-            .for_each(|(ia, &coeff)| {
-                let (i, a) = _inflate_index(ia as u32);
-                let c = Complex64::new(coeff, 0.0);
-                Self::_insert_1body_idx(self, c, i, a);
-                Self::_insert_1body_idx(self, c, i + norb, a + norb);
-            });
+        Self::_reserve_terms(self, 2 * _count_1body_terms(one_body_a), 2);
+        Self::_extend_nonzero(self, one_body_a, |op, ia, coeff| {
+            let (i, a) = _inflate_index(ia);
+            let c = Complex64::new(coeff, 0.0);
+            Self::_insert_1body_idx(op, c, i, a);
+            Self::_insert_1body_idx(op, c, i + norb, a + norb);
+        });
     }
 
     fn from_1body_tril_spin_sym(one_body_a: ArrayView1<f64>, norb: u32) -> Self {
@@ -157,23 +212,23 @@ impl From1Body for FermionOperator {
         one_body_b: ArrayView1<f64>,
         norb: u32,
     ) {
-        one_body_a
-            .indexed_iter()
-            .filter(|&(_, coeff)| coeff.abs() > 0.0)
-            .for_each(|(ia, &coeff)| {
-                let (i, a) = _inflate_index(ia as u32);
-                let c = Complex64::new(coeff, 0.0);
-                Self::_insert_1body_idx(self, c, i, a);
-            });
+        Self::_reserve_terms(
+            self,
+            _count_1body_terms(one_body_a) + _count_1body_terms(one_body_b),
+            2,
+        );
 
-        one_body_b
-            .indexed_iter()
-            .filter(|&(_, coeff)| coeff.abs() > 0.0)
-            .for_each(|(ia, &coeff)| {
-                let (i, a) = _inflate_index(ia as u32);
-                let c = Complex64::new(coeff, 0.0);
-                Self::_insert_1body_idx(self, c, i + norb, a + norb);
-            });
+        Self::_extend_nonzero(self, one_body_a, |op, ia, coeff| {
+            let (i, a) = _inflate_index(ia);
+            let c = Complex64::new(coeff, 0.0);
+            Self::_insert_1body_idx(op, c, i, a);
+        });
+
+        Self::_extend_nonzero(self, one_body_b, |op, ia, coeff| {
+            let (i, a) = _inflate_index(ia);
+            let c = Complex64::new(coeff, 0.0);
+            Self::_insert_1body_idx(op, c, i + norb, a + norb);
+        });
     }
 
     fn from_1body_tril_spin(
@@ -214,20 +269,16 @@ pub trait From2Body {
 
 impl From2Body for FermionOperator {
     fn add_2body_tril_spin_sym(&mut self, two_body_aa: ArrayView1<f64>, norb: u32) {
-        two_body_aa
-            .indexed_iter()
-            .filter(|&(_, coeff)| coeff.abs() > 0.0)
-            .for_each(|(iajb, &coeff)| {
-                let c = Complex64::new(0.5 * coeff, 0.0);
-                _expand_s8_index(iajb as u32)
-                    .iter()
-                    .for_each(|&(i, a, j, b)| {
-                        Self::_insert_2body_idx(self, c, i, j, b, a);
-                        Self::_insert_2body_idx(self, c, i + norb, j, b, a + norb);
-                        Self::_insert_2body_idx(self, c, i, j + norb, b + norb, a);
-                        Self::_insert_2body_idx(self, c, i + norb, j + norb, b + norb, a + norb);
-                    });
+        Self::_reserve_terms(self, 4 * _count_s8_terms(two_body_aa), 4);
+        Self::_extend_nonzero(self, two_body_aa, |op, iajb, coeff| {
+            let c = Complex64::new(0.5 * coeff, 0.0);
+            _for_each_s8_index(iajb, |i, a, j, b| {
+                Self::_insert_2body_idx(op, c, i, j, b, a);
+                Self::_insert_2body_idx(op, c, i + norb, j, b, a + norb);
+                Self::_insert_2body_idx(op, c, i, j + norb, b + norb, a);
+                Self::_insert_2body_idx(op, c, i + norb, j + norb, b + norb, a + norb);
             });
+        });
     }
 
     fn from_2body_tril_spin_sym(two_body_aa: ArrayView1<f64>, norb: u32) -> Self {
@@ -243,43 +294,36 @@ impl From2Body for FermionOperator {
         two_body_bb: ArrayView1<f64>,
         norb: u32,
     ) {
-        two_body_aa
-            .indexed_iter()
-            .filter(|&(_, coeff)| coeff.abs() > 0.0)
-            .for_each(|(iajb, &coeff)| {
-                let c = Complex64::new(0.5 * coeff, 0.0);
-                _expand_s8_index(iajb as u32)
-                    .iter()
-                    .for_each(|&(i, a, j, b)| {
-                        Self::_insert_2body_idx(self, c, i, j, b, a);
-                    });
+        let npair = norb * (norb + 1) / 2;
+        Self::_reserve_terms(
+            self,
+            _count_s8_terms(two_body_aa)
+                + 2 * _count_s4_terms(two_body_ab, npair)
+                + _count_s8_terms(two_body_bb),
+            4,
+        );
+
+        Self::_extend_nonzero(self, two_body_aa, |op, iajb, coeff| {
+            let c = Complex64::new(0.5 * coeff, 0.0);
+            _for_each_s8_index(iajb, |i, a, j, b| {
+                Self::_insert_2body_idx(op, c, i, j, b, a);
             });
+        });
 
-        let npair = norb * (norb + 1) / 2;
-        two_body_ab
-            .indexed_iter()
-            .filter(|&(_, coeff)| coeff.abs() > 0.0)
-            .for_each(|(iajb, &coeff)| {
-                let c = Complex64::new(0.5 * coeff, 0.0);
-                _expand_s4_index(iajb as u32, npair)
-                    .iter()
-                    .for_each(|&(i, a, j, b)| {
-                        Self::_insert_2body_idx(self, c, i, j + norb, b + norb, a);
-                        Self::_insert_2body_idx(self, c, j + norb, i, a, b + norb);
-                    });
+        Self::_extend_nonzero(self, two_body_ab, |op, iajb, coeff| {
+            let c = Complex64::new(0.5 * coeff, 0.0);
+            _for_each_s4_index(iajb, npair, |i, a, j, b| {
+                Self::_insert_2body_idx(op, c, i, j + norb, b + norb, a);
+                Self::_insert_2body_idx(op, c, j + norb, i, a, b + norb);
             });
+        });
 
-        two_body_bb
-            .indexed_iter()
-            .filter(|&(_, coeff)| coeff.abs() > 0.0)
-            .for_each(|(iajb, &coeff)| {
-                let c = Complex64::new(0.5 * coeff, 0.0);
-                _expand_s8_index(iajb as u32)
-                    .iter()
-                    .for_each(|&(i, a, j, b)| {
-                        Self::_insert_2body_idx(self, c, i + norb, j + norb, b + norb, a + norb);
-                    });
+        Self::_extend_nonzero(self, two_body_bb, |op, iajb, coeff| {
+            let c = Complex64::new(0.5 * coeff, 0.0);
+            _for_each_s8_index(iajb, |i, a, j, b| {
+                Self::_insert_2body_idx(op, c, i + norb, j + norb, b + norb, a + norb);
             });
+        });
     }
 
     fn from_2body_tril_spin(
@@ -83,8 +83,6 @@ impl FCIDump {
         let num_s4 = npair * npair;
         let num_s8 = npair * (npair + 1) / 2;
 
-        let integral_line = Regex::new(r"(.+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)").unwrap();
-
         let mut beta_present: bool = false;
         let mut constant: Option<f64> = None;
         let mut one_body_a = Array1::<f64>::zeros(npair);
@@ -94,14 +92,29 @@ impl FCIDump {
         let mut two_body_bb = Array1::<f64>::zeros(num_s8);
 
         for line in integrals.lines() {
-            let Some(integral) = integral_line.captures(line.trim()) else {
+            // NOTE: every integral line consists of exactly five whitespace-separated fields. These
+            // get split and parsed in-place, which avoids matching a regex and allocating a string
+            // for every field of what may be millions of lines.
+            let mut fields = line.split_ascii_whitespace();
+            let (Some(coeff), Some(i), Some(a), Some(j), Some(b), None) = (
+                fields.next(),
+                fields.next(),
+                fields.next(),
+                fields.next(),
+                fields.next(),
+                fields.next(),
+            ) else {
+                continue;
+            };
+            let (Ok(coeff), Ok(i), Ok(a), Ok(j), Ok(b)) = (
+                coeff.trim_end_matches(',').parse::<f64>(),
+                i.parse::<usize>(),
+                a.parse::<usize>(),
+                j.parse::<usize>(),
+                b.parse::<usize>(),
+            ) else {
                 continue;
             };
-            let coeff = unwrap_cap(&integral, 1).parse::<f64>().unwrap();
-            let i = unwrap_cap(&integral, 2).parse::<usize>().unwrap();
-            let a = unwrap_cap(&integral, 3).parse::<usize>().unwrap();
-            let j = unwrap_cap(&integral, 4).parse::<usize>().unwrap();
-            let b = unwrap_cap(&integral, 5).parse::<usize>().unwrap();
 
             match (i, a, j, b) {
                 (0, 0, 0, 0) => constant = Some(coeff),
@@ -248,6 +261,22 @@ mod tests {
         assert_eq!(fcidump, expected);
     }
 
+    #[test]
+    fn test_from_file_malformed_lines() {
+        let contents = std::fs::read_to_string("../../tests/h2.fcidump").unwrap();
+        let file_path = std::env::temp_dir().join("qiskit_fermions_malformed.fcidump");
+        std::fs::write(
+            &file_path,
+            format!("{contents} 1.0D-01   1   2   1   2\n 1.0   x   1   0   0\n"),
+        )
+        .unwrap();
+        let fcidump = FCIDump::from_file(file_path.to_string_lossy().into_owned());
+        std::fs::remove_file(&file_path).unwrap();
+
+        let expected = FCIDump::from_file(String::from("../../tests/h2.fcidump"));
+        assert_eq!(fcidump, expected);
+    }
+
     #[test]
     fn test_to_fermion_operator() {
         let fcidump = FCIDump {
@@ -13,3 +13,4 @@
 pub mod commutators;
 pub mod electronic_integrals;
 pub mod fcidump;
+pub mod polynomial_tensor;
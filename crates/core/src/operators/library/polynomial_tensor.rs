@@ -0,0 +1,76 @@
+// This code is a Qiskit project.
+//
+// (C) Copyright IBM 2026.
+//
+// This code is licensed under the Apache License, Version 2.0. You may
+// obtain a copy of this license in the LICENSE.txt file in the root directory
+// of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+//
+// Any modifications or derivative works of this code must retain this
+// copyright notice, and modified files need to carry a notice indicating
+// that they have been altered from the originals.
+
+use crate::operators::fermion_operator::FermionOperator;
+use ndarray::{ArrayViewD, Dimension};
+use num_complex::Complex64;
+use num_traits::Zero;
+
+pub trait FromPolynomialTensor {
+    fn add_dense_tensor(&mut self, actions: &[bool], tensor: ArrayViewD<Complex64>);
+}
+
+impl FromPolynomialTensor for FermionOperator {
+    /// Appends one term per nonzero entry of `tensor`.
+    ///
+    /// Every term applies the provided `actions` in order, acting on the modes given by the
+    /// multi-dimensional index of the entry. Thus, `tensor` must have one axis per action.
+    fn add_dense_tensor(&mut self, actions: &[bool], tensor: ArrayViewD<Complex64>) {
+        assert_eq!(actions.len(), tensor.ndim());
+
+        let num_terms = tensor.iter().filter(|coeff| !coeff.is_zero()).count();
+        self.coeffs.reserve(num_terms);
+        self.actions.reserve(num_terms * actions.len());
+        self.indices.reserve(num_terms * actions.len());
+        self.boundaries.reserve(num_terms);
+
+        for (index, coeff) in tensor.indexed_iter() {
+            if coeff.is_zero() {
+                continue;
+            }
+            self.coeffs.push(*coeff);
+            self.actions.extend_from_slice(actions);
+            self.indices
+                .extend(index.slice().iter().map(|idx| *idx as u32));
+            self.boundaries.push(self.indices.len());
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::operators::OperatorTrait;
+    use ndarray::{Array2, arr0};
+
+    #[test]
+    fn test_add_dense_tensor() {
+        let mut op = FermionOperator::zero();
+        op.add_dense_tensor(&[], arr0(Complex64::new(0.5, 0.0)).into_dyn().view());
+        let mut one_body = Array2::<Complex64>::zeros((2, 2));
+        one_body[[0, 1]] = Complex64::new(1.0, 0.0);
+        one_body[[1, 0]] = Complex64::new(2.0, 0.0);
+        op.add_dense_tensor(&[true, false], one_body.into_dyn().view());
+
+        let expected = FermionOperator {
+            coeffs: vec![
+                Complex64::new(0.5, 0.0),
+                Complex64::new(1.0, 0.0),
+                Complex64::new(2.0, 0.0),
+            ],
+            actions: vec![true, false, true, false],
+            indices: vec![0, 1, 1, 0],
+            boundaries: vec![0, 0, 2, 4],
+        };
+        assert_eq!(op, expected);
+    }
+}
@@ -13,6 +13,8 @@
 use crate::operators::{OperatorMacro, OperatorTrait};
 use num_complex::{Complex64, ComplexFloat};
 use std::collections::HashMap;
+use std::collections::hash_map::Entry;
+use std::iter::zip;
 use std::ops::{
     Add, AddAssign, BitAnd, BitAndAssign, Div, DivAssign, Mul, MulAssign, Neg, Sub, SubAssign,
 };
@@ -52,19 +54,27 @@ crate::impl_operator_macro!(MajoranaOperator);
 
 impl MajoranaOperator {
     pub fn simplify(&self, atol: f64) -> Self {
-        let mut terms = HashMap::new();
+        // NOTE: equal terms are summed into the position of their first occurrence. This keeps the
+        // output order deterministic and allows the tolerance to be applied in a single pass over
+        // the unique terms rather than iterating the hash map.
+        let mut positions = HashMap::with_capacity(self.coeffs.len());
+        let mut terms = Vec::with_capacity(self.coeffs.len());
+        let mut coeffs = Vec::<Complex64>::with_capacity(self.coeffs.len());
         for term in self.iter() {
-            terms
-                .entry(term.modes)
-                .and_modify(|c| *c += term.coeff)
-                .or_insert(term.coeff);
+            match positions.entry(term.modes) {
+                Entry::Occupied(entry) => coeffs[*entry.get()] += term.coeff,
+                Entry::Vacant(entry) => {
+                    entry.insert(terms.len());
+                    terms.push(term.modes);
+                    coeffs.push(term.coeff);
+                }
+            }
         }
         let mut out = Self::zero();
-        terms
-            .iter()
+        zip(terms, coeffs)
             .filter(|(_, coeff)| coeff.abs() > atol)
             .for_each(|(modes, coeff)| {
-                out.coeffs.push(*coeff);
+                out.coeffs.push(coeff);
                 out.modes.extend_from_slice(modes);
                 out.boundaries.push(out.modes.len());
             });
@@ -83,17 +93,23 @@ impl MajoranaOperator {
     }
 
     pub fn normal_ordered(&self, reduce: bool) -> Self {
-        let mut coeffs = vec![];
-        let mut modes = vec![];
-        let mut boundaries = vec![0];
-
+        let mut coeffs = Vec::with_capacity(self.coeffs.len());
+        let mut modes = Vec::with_capacity(self.modes.len());
+        let mut boundaries = Vec::with_capacity(self.boundaries.len());
+        boundaries.push(0);
+
+        // NOTE: every term gets sorted within a single scratch buffer, which is reused across all
+        // terms rather than allocating new vectors per term.
+        let mut scratch = Vec::new();
         for term in self.iter() {
-            let (mut sorted_term, sign) = sort_and_parity(term.modes);
+            scratch.clear();
+            scratch.extend_from_slice(term.modes);
+            let parity = sort_with_parity(&mut scratch);
             if reduce {
-                sorted_term = reduce_pairs(&sorted_term);
+                reduce_pairs(&mut scratch);
             }
-            coeffs.push(Complex64::new(sign as f64, 0.0) * term.coeff);
-            modes.extend_from_slice(&sorted_term);
+            coeffs.push(if parity { -term.coeff } else { term.coeff });
+            modes.extend_from_slice(&scratch);
             boundaries.push(modes.len());
         }
         Self {
@@ -104,117 +120,71 @@ impl MajoranaOperator {
     }
 
     pub fn is_hermitian(&self, atol: f64) -> bool {
-        let mut diff = (self.__sub__(&self.adjoint())).normal_ordered(true);
+        // NOTE: the difference is built in-place from the adjoint and, once normal-ordered, gets
+        // simplified directly. Comparing it against a zero operator via `equiv` would subtract and
+        // copy it once more. The operator is Hermitian if no terms survive the simplification.
+        let mut diff = self.adjoint();
+        diff.__imul__(Complex64::new(-1.0, 0.0));
+        diff.__iadd__(self);
+        let mut diff = diff.normal_ordered(true);
         diff.ichop(atol);
-        diff.equiv(&Self::zero(), atol)
+        diff.simplify(atol).coeffs.is_empty()
     }
 
     pub fn many_body_order(&self) -> u32 {
-        let mut max = 0;
-        let mut prev_b = 0;
-        // TODO: refactor this
-        self.boundaries[1..].iter().for_each(|b| {
-            let d = b - prev_b;
-            if d > max {
-                max = d;
-            }
-            prev_b = *b;
-        });
-        max as u32
+        self.boundaries
+            .windows(2)
+            .map(|bounds| bounds[1] - bounds[0])
+            .max()
+            .unwrap_or(0) as u32
     }
 
     pub fn is_even(&self) -> bool {
-        let mut prev_b = 0;
-        for b in self.boundaries[1..].iter() {
-            if (b - prev_b) % 2 != 0 {
-                return false;
-            }
-            prev_b = *b;
-        }
-        true
+        self.boundaries
+            .windows(2)
+            .all(|bounds| (bounds[1] - bounds[0]) % 2 == 0)
     }
 }
 
-/// FIXME: follow rustdoc standards
-///
-/// Compute the parity of a permutation using cycle decomposition.
+/// Sorts the modes of a term in descending order and returns the parity of the sorting
+/// permutation.
 ///
-/// Args:
-///     perm: array of modes representing the permutation.
-///
-/// Returns:
-///     +1 if the permutation is even, -1 if it is odd.
-fn permutation_parity(perm: &[usize]) -> i32 {
-    let n = perm.len();
-    let mut visited = vec![false; n];
-    let mut sign = 1;
-
-    for i in 0..n {
-        if !visited[i] {
-            let mut cycle_len = 0;
-            let mut j = i;
-            while !visited[j] {
-                visited[j] = true;
-                j = perm[j];
-                cycle_len += 1;
-            }
-            if cycle_len > 0 && cycle_len % 2 == 0 {
-                sign = -sign;
-            }
+/// The modes are insertion-sorted in-place by swapping adjacent modes, each of which anticommutes
+/// and thus flips the parity. Equal modes are never swapped, such that the returned value is `true`
+/// if and only if an odd number of swaps was required.
+fn sort_with_parity(modes: &mut [u32]) -> bool {
+    let mut parity = false;
+    for i in 1..modes.len() {
+        let mut j = i;
+        while j > 0 && modes[j - 1] < modes[j] {
+            modes.swap(j - 1, j);
+            parity = !parity;
+            j -= 1;
         }
     }
-
-    sign
-}
-
-/// FIXME: follow rustdoc standards
-///
-/// Sort a list and compute the parity of the sorting permutation.
-///
-/// Args:
-///     tpl: tuple of integers to be sorted.
-///
-/// Returns:
-///     A tuple (sorted_tpl, sign):
-///     - sorted_tpl: tuple containing the sorted integers.
-///     - sign: +1 if the sorting permutation is even, -1 if it is odd.
-fn sort_and_parity(tpl: &[u32]) -> (Vec<u32>, i32) {
-    let mut indexed: Vec<(usize, u32)> = tpl.iter().cloned().enumerate().collect();
-    // we need stable sort to ensure that the parity is correctly computed
-    indexed.sort_by_key(|&(_, val)| -(val as i32));
-
-    let perm: Vec<usize> = indexed.iter().map(|&(i, _)| i).collect();
-    let sorted_tpl: Vec<u32> = indexed.iter().map(|&(_, val)| val).collect();
-
-    (sorted_tpl, permutation_parity(&perm))
+    parity
 }
 
-/// FIXME: follow rustdoc standards
+/// Removes pairs of consecutive equal modes in-place.
 ///
-/// Remove pairs of (consecutive) equal integers from a list.
-///
-/// Args:
-///     tpl: tuple of integers.
-///
-/// Returns:
-///     A tuple of integers after removing pairs.
-fn reduce_pairs(tpl: &[u32]) -> Vec<u32> {
-    let mut reduced = Vec::new();
+/// Since every Majorana mode squares to the identity, a run of equal modes reduces to a single
+/// mode if its length is odd and vanishes otherwise.
+fn reduce_pairs(modes: &mut Vec<u32>) {
+    let n = modes.len();
+    let mut num_reduced = 0;
     let mut i = 0;
-    let n = tpl.len();
-
     while i < n {
         let mut count = 1;
-        while i + count < n && tpl[i + count] == tpl[i] {
+        while i + count < n && modes[i + count] == modes[i] {
             count += 1;
         }
         if count % 2 == 1 {
-            reduced.push(tpl[i]);
+            modes[num_reduced] = modes[i];
+            num_reduced += 1;
         }
         i += count;
     }
-
-    reduced
+    modes.truncate(num_reduced);
 }
 
 impl OperatorTrait for MajoranaOperator {
@@ -235,30 +205,20 @@ impl OperatorTrait for MajoranaOperator {
     }
 
     fn equiv(&self, other: &Self, atol: f64) -> bool {
-        let mut diff = self.__sub__(other);
-        diff = diff.simplify(atol);
-        for c in diff.coeffs {
-            if c.abs() > atol {
-                return false;
-            }
-        }
-        true
+        // NOTE: simplifying the difference already drops all terms whose coefficient magnitude does
+        // not exceed `atol`. Thus, both operators are equivalent if no terms survive it.
+        self.__sub__(other).simplify(atol).coeffs.is_empty()
     }
 
     fn adjoint(&self) -> Self {
-        let mut coeffs = vec![];
-        let mut modes = vec![];
-
-        self.iter().for_each(|term| {
-            coeffs.push(term.coeff.conj());
-            modes.extend(term.modes.iter().rev());
+        // NOTE: the buffers are copied in bulk and then transformed in-place, reversing the modes of
+        // each term within its own slice. The boundaries remain unchanged.
+        let mut adjoint = self.clone();
+        adjoint.coeffs.iter_mut().for_each(|c| *c = c.conj());
+        self.boundaries.windows(2).for_each(|bounds| {
+            adjoint.modes[bounds[0]..bounds[1]].reverse();
         });
-
-        Self {
-            coeffs,
-            modes,
-            boundaries: self.boundaries.to_vec(),
-        }
+        adjoint
     }
 
     fn __iadd__(&mut self, other: &Self) {
@@ -293,21 +253,25 @@ impl OperatorTrait for MajoranaOperator {
     }
 
     fn ichop(&mut self, atol: f64) {
-        let mut coeffs = vec![];
-        let mut modes = vec![];
-        let mut boundaries = vec![0];
-
-        self.iter()
-            .filter(|term| term.coeff.abs() > atol)
-            .for_each(|term| {
-                coeffs.push(term.coeff.conj());
-                modes.extend_from_slice(term.modes);
-                boundaries.push(modes.len());
-            });
-
-        self.coeffs = coeffs;
-        self.modes = modes;
-        self.boundaries = boundaries;
+        // NOTE: the retained terms get compacted in-place by moving them forward within the
+        // existing buffers, rather than copying them into newly allocated ones.
+        let mut num_terms = 0;
+        let mut num_modes = 0;
+        for i in 0..self.coeffs.len() {
+            let coeff = self.coeffs[i];
+            if coeff.abs() <= atol {
+                continue;
+            }
+            let (start, end) = (self.boundaries[i], self.boundaries[i + 1]);
+            self.modes.copy_within(start..end, num_modes);
+            num_modes += end - start;
+            self.coeffs[num_terms] = coeff;
+            num_terms += 1;
+            self.boundaries[num_terms] = num_modes;
+        }
+        self.coeffs.truncate(num_terms);
+        self.modes.truncate(num_modes);
+        self.boundaries.truncate(num_terms + 1);
     }
 }
 
@@ -57,7 +57,7 @@ macro_rules! impl_operator_macro {
                 Self: OperatorTrait,
             {
                 let mut result = self.clone();
-                result.__iadd__(&other.__neg__());
+                result.__isub__(other);
                 result
             }
 
@@ -65,7 +65,12 @@ macro_rules! impl_operator_macro {
             where
                 Self: OperatorTrait,
             {
-                self.__iadd__(&other.__neg__());
+                // NOTE: the terms of `other` get appended as they are and only the copied
+                // coefficients get negated afterwards, which avoids constructing a negated copy of
+                // `other` first.
+                let offset = self.coeffs.len();
+                self.__iadd__(other);
+                self.coeffs[offset..].iter_mut().for_each(|c| *c = -*c);
             }
 
             fn __mul__(&self, other: Complex64) -> Self
@@ -113,9 +118,20 @@ macro_rules! impl_operator_macro {
             where
                 Self: OperatorTrait,
             {
+                // NOTE: this uses exponentiation by squaring, which requires only a logarithmic
+                // number of compositions. Since all factors are powers of `self`, they commute and
+                // the order in which they get composed does not matter.
                 let mut result = Self::one();
-                for _ in 0..exponent {
-                    result.__iand__(self);
+                let mut base = self.clone();
+                let mut exponent = exponent;
+                while exponent > 0 {
+                    if exponent & 1 == 1 {
+                        result.__iand__(&base);
+                    }
+                    exponent >>= 1;
+                    if exponent > 0 {
+                        base = base.__and__(&base);
+                    }
                 }
                 result
             }
@@ -0,0 +1,463 @@
+// This code is a Qiskit project.
+//
+// (C) Copyright IBM 2026.
+//
+// This code is licensed under the Apache License, Version 2.0. You may
+// obtain a copy of this license in the LICENSE.txt file in the root directory
+// of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+//
+// Any modifications or derivative works of this code must retain this
+// copyright notice, and modified files need to carry a notice indicating
+// that they have been altered from the originals.
+
+use crate::operators::fermion_operator::{PyFermionOperator, fermion_action_type};
+use crate::operators::majorana_operator::PyMajoranaOperator;
+use num_complex::Complex64;
+use numpy::PyArray1;
+use pyo3::ffi;
+use pyo3::intern;
+use pyo3::prelude::*;
+use pyo3::types::{PyList, PySlice};
+use pyo3_stub_gen::derive::*;
+use std::cell::RefCell;
+use std::collections::HashMap;
+use std::collections::hash_map::Entry;
+
+/// Performs ``acc += other`` honoring a potential ``__iadd__`` implementation of the output type.
+fn inplace_add<'py>(
+    acc: Bound<'py, PyAny>,
+    other: &Bound<'py, PyAny>,
+) -> PyResult<Bound<'py, PyAny>> {
+    unsafe {
+        Bound::from_owned_ptr_or_err(
+            acc.py(),
+            ffi::PyNumber_InPlaceAdd(acc.as_ptr(), other.as_ptr()),
+        )
+    }
+}
+
+/// An action which gets passed to ``map_action`` and can be identified by a single integer.
+trait PackedAction {
+    fn packed(&self) -> u64;
+
+    /// Converts the action into the Python object which gets passed to ``map_action``.
+    fn to_object<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>>;
+}
+
+impl PackedAction for (bool, u32) {
+    fn packed(&self) -> u64 {
+        ((self.1 as u64) << 1) | self.0 as u64
+    }
+
+    fn to_object<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        fermion_action_type(py)?.call1(*self)
+    }
+}
+
+impl PackedAction for u32 {
+    fn packed(&self) -> u64 {
+        *self as u64
+    }
+
+    fn to_object<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        Ok((*self).into_pyobject(py)?.into_any())
+    }
+}
+
+/// The Python callables and options which drive the mapping of an operator.
+struct ActionMapper<'a, 'py> {
+    map_action: &'a Bound<'py, PyAny>,
+    /// The outputs of ``map_action`` keyed by their packed action (if caching is enabled).
+    cache: Option<RefCell<HashMap<u64, Bound<'py, PyAny>>>>,
+    identity: &'a Bound<'py, PyAny>,
+    /// The identity instance shared among all terms (unless a fresh one is requested per term).
+    shared_identity: Option<Bound<'py, PyAny>>,
+    /// An unused identity instance which was constructed up front to determine the output type.
+    /// When fresh instances are requested per term, this gets handed out first.
+    spare_identity: RefCell<Option<Bound<'py, PyAny>>>,
+    /// The composition callable. This is ``None`` when ``&`` should be used directly.
+    compose: Option<Bound<'py, PyAny>>,
+    zero: Option<&'a Bound<'py, PyAny>>,
+    batch_sum: Option<&'a Bound<'py, PyAny>>,
+    tree_reduce: bool,
+    group_by_coeff: bool,
+}
+
+impl<'a, 'py> ActionMapper<'a, 'py> {
+    /// Constructs a new mapper from the arguments of the Python mapper functions.
+    ///
+    /// Without a user-provided ``compose`` callable, the ``_compose_`` method of the output type
+    /// is used if it exists (see :class:`.SupportsFastCompose`). The output type is determined
+    /// from the instance returned by ``identity``.
+    #[allow(clippy::too_many_arguments)]
+    fn new(
+        map_action: &'a Bound<'py, PyAny>,
+        identity: &'a Bound<'py, PyAny>,
+        compose: Option<&'a Bound<'py, PyAny>>,
+        cache: bool,
+        zero: Option<&'a Bound<'py, PyAny>>,
+        batch_sum: Option<&'a Bound<'py, PyAny>>,
+        tree_reduce: bool,
+        group_by_coeff: bool,
+        fresh_identity: bool,
+    ) -> PyResult<Self> {
+        // NOTE: an identity instance is only probed for the output type when no `compose` callable
+        // is provided. It is never wasted: either it becomes the shared identity or it gets handed
+        // out by the first call of `Self::identity`.
+        let mut spare_identity = None;
+        let compose = match compose {
+            Some(compose) => Some(compose.clone()),
+            None => {
+                let identity_instance = identity.call0()?;
+                let fast_compose = identity_instance
+                    .get_type()
+                    .getattr_opt(intern!(identity.py(), "_compose_"))?;
+                spare_identity = Some(identity_instance);
+                fast_compose
+            }
+        };
+        let shared_identity = if fresh_identity {
+            None
+        } else {
+            Some(match spare_identity.take() {
+                Some(identity_instance) => identity_instance,
+                None => identity.call0()?,
+            })
+        };
+        Ok(Self {
+            map_action,
+            cache: cache.then(RefCell::default),
+            identity,
+            shared_identity,
+            spare_identity: RefCell::new(spare_identity),
+            compose,
+            zero,
+            batch_sum,
+            tree_reduce,
+            group_by_coeff,
+        })
+    }
+
+    /// Returns the multiplicative identity instance of the output type.
+    fn identity(&self) -> PyResult<Bound<'py, PyAny>> {
+        match &self.shared_identity {
+            Some(identity) => Ok(identity.clone()),
+            None => match self.spare_identity.take() {
+                Some(identity) => Ok(identity),
+                None => self.identity.call0(),
+            },
+        }
+    }
+
+    /// Returns the additive identity instance of the output type.
+    ///
+    /// This uses the ``zero`` callable when it is provided and falls back to ``0 * identity()``.
+    fn zero(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        match self.zero {
+            Some(zero) => zero.call0(),
+            None => 0_i64.into_pyobject(py)?.mul(self.identity()?),
+        }
+    }
+
+    /// Composes two output instances.
+    ///
+    /// Without a ``compose`` callable, this dispatches to ``left & right`` directly rather than
+    /// going through a Python-level call of :py:func:`operator.and_`.
+    fn compose(
+        &self,
+        left: Bound<'py, PyAny>,
+        right: Bound<'py, PyAny>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        match &self.compose {
+            Some(compose) => compose.call1((left, right)),
+            None => left.bitand(right),
+        }
+    }
+
+    /// Maps a single action.
+    ///
+    /// When caching is enabled, ``map_action`` only gets called for the first occurrence of every
+    /// action. The cache is keyed on the packed integer representation of the actions, such that
+    /// cache hits need to neither convert the action to Python nor hash it in Python.
+    fn map_action<T>(&self, action: T) -> PyResult<Bound<'py, PyAny>>
+    where
+        T: PackedAction,
+    {
+        let py = self.map_action.py();
+        let Some(cache) = &self.cache else {
+            return self.map_action.call1((action.to_object(py)?,));
+        };
+        let key = action.packed();
+        if let Some(mapped) = cache.borrow().get(&key) {
+            return Ok(mapped.clone());
+        }
+        let mapped = self.map_action.call1((action.to_object(py)?,))?;
+        cache.borrow_mut().insert(key, mapped.clone());
+        Ok(mapped)
+    }
+
+    /// Maps the actions of a single term and composes them into a single output instance.
+    fn map_term<J, T>(&self, mut actions: J) -> PyResult<Bound<'py, PyAny>>
+    where
+        J: Iterator<Item = T>,
+        T: PackedAction,
+    {
+        if !self.tree_reduce {
+            return actions.try_fold(self.identity()?, |acc, action| {
+                self.compose(self.map_action(action)?, acc)
+            });
+        }
+
+        let mut mapped_actions = actions
+            .map(|action| self.map_action(action))
+            .collect::<PyResult<Vec<_>>>()?;
+        if mapped_actions.is_empty() {
+            return self.identity();
+        }
+        // NOTE: we compose adjacent pairs until a single instance remains. Later actions are
+        // composed from the left, just like in the left-fold above.
+        while mapped_actions.len() > 1 {
+            let mut reduced = Vec::with_capacity(mapped_actions.len().div_ceil(2));
+            let mut pairs = mapped_actions.into_iter();
+            while let Some(first) = pairs.next() {
+                match pairs.next() {
+                    Some(second) => reduced.push(self.compose(second, first)?),
+                    None => reduced.push(first),
+                }
+            }
+            mapped_actions = reduced;
+        }
+        Ok(mapped_actions.pop().unwrap())
+    }
+
+    /// Maps the terms of an operator and sums them up per distinct coefficient.
+    ///
+    /// The groups are returned in the order in which their coefficients are first encountered.
+    fn map_grouped_terms<I, J, T>(
+        &self,
+        py: Python<'py>,
+        terms: I,
+    ) -> PyResult<Vec<(Complex64, Bound<'py, PyAny>)>>
+    where
+        I: Iterator<Item = (Complex64, J)>,
+        J: Iterator<Item = T>,
+        T: PackedAction,
+    {
+        let mut groups: Vec<(Complex64, Bound<'py, PyAny>)> = Vec::new();
+        let mut group_indices: HashMap<[u64; 2], usize> = HashMap::new();
+        for (coeff, actions) in terms {
+            let mapped_terms = self.map_term(actions)?;
+            let index = match group_indices.entry([coeff.re.to_bits(), coeff.im.to_bits()]) {
+                Entry::Occupied(entry) => *entry.get(),
+                Entry::Vacant(entry) => {
+                    // NOTE: each group starts out from a fresh zero instance, because the mapped
+                    // terms may be (cached) outputs of `map_action` which must not be modified
+                    // in-place.
+                    groups.push((coeff, self.zero(py)?));
+                    *entry.insert(groups.len() - 1)
+                }
+            };
+            let group = &mut groups[index].1;
+            *group = inplace_add(group.clone(), &mapped_terms)?;
+        }
+        Ok(groups)
+    }
+
+    /// Sums up the scaled terms starting from the provided ``zero`` instance.
+    ///
+    /// When a ``batch_sum`` callable is provided, all terms are collected first and summed up with
+    /// a single call. Otherwise, they are accumulated one after another via ``+=``.
+    fn accumulate<I>(
+        &self,
+        py: Python<'py>,
+        zero: Bound<'py, PyAny>,
+        mut scaled_terms: I,
+    ) -> PyResult<Bound<'py, PyAny>>
+    where
+        I: Iterator<Item = PyResult<Bound<'py, PyAny>>>,
+    {
+        match self.batch_sum {
+            Some(batch_sum) => {
+                // NOTE: the zero instance is included such that the sum is never empty.
+                let items = std::iter::once(Ok(zero))
+                    .chain(scaled_terms)
+                    .collect::<PyResult<Vec<_>>>()?;
+                batch_sum.call1((PyList::new(py, items)?,))
+            }
+            None => scaled_terms.try_fold(zero, |acc, item| inplace_add(acc, &item?)),
+        }
+    }
+
+    /// Maps the terms of an operator and sums up the result.
+    ///
+    /// This is the native counterpart of the pure Python reduction loop which used to live in the
+    /// ``qiskit_fermions.mappers`` module. The terms are read directly from the operator storage
+    /// such that no intermediate Python lists of actions need to be materialized. Python is only
+    /// called into at the leaf points of the reduction (mapping, composing, scaling and summing).
+    fn map_terms<I, J, T>(&self, py: Python<'py>, terms: I) -> PyResult<Bound<'py, PyAny>>
+    where
+        I: Iterator<Item = (Complex64, J)>,
+        J: Iterator<Item = T>,
+        T: PackedAction,
+    {
+        let zero = self.zero(py)?;
+        // NOTE: we multiply from the right, such that the output type's `__mul__` gets dispatched
+        // to directly rather than having to go through `complex.__mul__` returning
+        // `NotImplemented` before falling back to `__rmul__`.
+        if self.group_by_coeff {
+            let groups = self.map_grouped_terms(py, terms)?;
+            let scaled_groups = groups.into_iter().map(|(coeff, group)| group.mul(coeff));
+            return self.accumulate(py, zero, scaled_groups);
+        }
+        let scaled_terms = terms.map(|(coeff, actions)| self.map_term(actions)?.mul(coeff));
+        self.accumulate(py, zero, scaled_terms)
+    }
+}
+
+/// The native implementation of :func:`qiskit_fermions.mappers.map_fermion_action_generators`.
+///
+/// Refer to the documentation of the public Python function for more details.
+#[gen_stub_pyfunction(module = "qiskit_fermions.mappers.generators")]
+#[pyfunction(name = "map_fermion_action_generators")]
+#[pyo3(signature = (
+    operator,
+    map_action,
+    identity,
+    compose=None,
+    cache=true,
+    zero=None,
+    batch_sum=None,
+    tree_reduce=false,
+    group_by_coeff=false,
+    fresh_identity=false,
+))]
+#[allow(clippy::too_many_arguments)]
+pub fn py_map_fermion_action_generators<'py>(
+    py: Python<'py>,
+    operator: PyRef<'py, PyFermionOperator>,
+    map_action: &Bound<'py, PyAny>,
+    identity: &Bound<'py, PyAny>,
+    compose: Option<&Bound<'py, PyAny>>,
+    cache: bool,
+    zero: Option<&Bound<'py, PyAny>>,
+    batch_sum: Option<&Bound<'py, PyAny>>,
+    tree_reduce: bool,
+    group_by_coeff: bool,
+    fresh_identity: bool,
+) -> PyResult<Bound<'py, PyAny>> {
+    let mapper = ActionMapper::new(
+        map_action,
+        identity,
+        compose,
+        cache,
+        zero,
+        batch_sum,
+        tree_reduce,
+        group_by_coeff,
+        fresh_identity,
+    )?;
+    let terms = operator.inner.iter().map(|term| {
+        let actions = term.actions.iter().copied();
+        (term.coeff, actions.zip(term.indices.iter().copied()))
+    });
+    mapper.map_terms(py, terms)
+}
+
+/// The native implementation of :func:`qiskit_fermions.mappers.map_majorana_action_generators`.
+///
+/// Refer to the documentation of the public Python function for more details.
+#[gen_stub_pyfunction(module = "qiskit_fermions.mappers.generators")]
+#[pyfunction(name = "map_majorana_action_generators")]
+#[pyo3(signature = (
+    operator,
+    map_action,
+    identity,
+    compose=None,
+    cache=true,
+    zero=None,
+    batch_sum=None,
+    tree_reduce=false,
+    group_by_coeff=false,
+    fresh_identity=false,
+))]
+#[allow(clippy::too_many_arguments)]
+pub fn py_map_majorana_action_generators<'py>(
+    py: Python<'py>,
+    operator: PyRef<'py, PyMajoranaOperator>,
+    map_action: &Bound<'py, PyAny>,
+    identity: &Bound<'py, PyAny>,
+    compose: Option<&Bound<'py, PyAny>>,
+    cache: bool,
+    zero: Option<&Bound<'py, PyAny>>,
+    batch_sum: Option<&Bound<'py, PyAny>>,
+    tree_reduce: bool,
+    group_by_coeff: bool,
+    fresh_identity: bool,
+) -> PyResult<Bound<'py, PyAny>> {
+    let mapper = ActionMapper::new(
+        map_action,
+        identity,
+        compose,
+        cache,
+        zero,
+        batch_sum,
+        tree_reduce,
+        group_by_coeff,
+        fresh_identity,
+    )?;
+    let terms = operator
+        .inner
+        .iter()
+        .map(|term| (term.coeff, term.modes.iter().copied()));
+    mapper.map_terms(py, terms)
+}
+
+/// The native implementation of :func:`qiskit_fermions.mappers.map_fermion_packed_terms`.
+///
+/// Refer to the documentation of the public Python function for more details.
+#[gen_stub_pyfunction(module = "qiskit_fermions.mappers.generators")]
+#[pyfunction(name = "map_fermion_packed_terms")]
+#[pyo3(signature = (operator, map_term, identity, zero=None))]
+pub fn py_map_fermion_packed_terms<'py>(
+    py: Python<'py>,
+    operator: PyRef<'py, PyFermionOperator>,
+    map_term: &Bound<'py, PyAny>,
+    identity: &Bound<'py, PyAny>,
+    zero: Option<&Bound<'py, PyAny>>,
+) -> PyResult<Bound<'py, PyAny>> {
+    // NOTE: all actions get packed into a single array up front, such that each term is handed to
+    // `map_term` as a zero-copy view into it. The array is made read-only, such that `map_term`
+    // cannot modify the actions of later terms through its view.
+    let packed = PyArray1::from_vec(py, operator.inner.packed_actions());
+    packed.readwrite().make_nonwriteable();
+    // NOTE: the mapper only provides the initial accumulator here, such that `zero` and
+    // `identity` are handled the same way as for the action-based mapping.
+    let mapper = ActionMapper::new(
+        map_term, identity, None, false, zero, None, false, false, false,
+    )?;
+    let mut mapped_operator = mapper.zero(py)?;
+    for (coeff, bounds) in operator
+        .inner
+        .coeffs
+        .iter()
+        .zip(operator.inner.boundaries.windows(2))
+    {
+        let slice = PySlice::new(py, bounds[0] as isize, bounds[1] as isize, 1);
+        let mapped_term = map_term.call1((packed.get_item(slice)?,))?;
+        let scaled_term = mapped_term.mul(*coeff)?;
+        mapped_operator = inplace_add(mapped_operator, &scaled_term)?;
+    }
+    Ok(mapped_operator)
+}
+
+#[pymodule]
+pub mod generators {
+    #[pymodule_export]
+    use super::py_map_fermion_action_generators;
+
+    #[pymodule_export]
+    use super::py_map_fermion_packed_terms;
+
+    #[pymodule_export]
+    use super::py_map_majorana_action_generators;
+}
@@ -64,7 +64,7 @@ use qiskit_fermions_core::mappers::library::jordan_wigner::jordan_wigner;
 ///     ... )
 ///     >>> qop = jordan_wigner(fop, 4)
 ///     >>> qop.simplify()
-///     <SparseObservable with 5 terms on 4 qubits: (2.05-0.25j)() + (-0.05+0j)(Z_0) + (0+0.25j)(Z_1) + (0+0.25j)(Z_2 Z_1) + (0-0.25j)(Z_2)>
+///     <SparseObservable with 5 terms on 4 qubits: (2.05-0.25j)() + (-0.05+0j)(Z_0) + (0+0.25j)(Z_1) + (0-0.25j)(Z_2) + (0+0.25j)(Z_2 Z_1)>
 ///
 /// ----
 ///
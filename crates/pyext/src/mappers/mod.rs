@@ -12,10 +12,14 @@
 
 use pyo3::prelude::*;
 
+pub mod generators;
 pub mod library;
 
 #[pymodule]
 pub mod mappers {
+    #[pymodule_export]
+    use super::generators::generators;
+
     #[pymodule_export]
     use super::library::mappers_library;
 }
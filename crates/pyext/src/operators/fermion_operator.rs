@@ -11,24 +11,64 @@
 // that they have been altered from the originals.
 
 use num_complex::Complex64;
+use numpy::{PyArray1, PyReadonlyArray1};
 use pyo3::prelude::*;
-use pyo3::types::PyType;
-use pyo3::{class::basic::CompareOp, exceptions::PyNotImplementedError};
+use pyo3::sync::PyOnceLock;
+use pyo3::types::{PyDict, PyTuple, PyType};
+use pyo3::{
+    class::basic::CompareOp,
+    exceptions::{PyNotImplementedError, PyTypeError},
+};
 use pyo3_stub_gen::derive::*;
-use std::collections::HashMap;
+use std::fmt::{self, Write};
+use std::iter::zip;
 
+use crate::operators::{extract_boundaries_array, extract_coeffs_array};
 use qiskit_fermions_core::operators::fermion_operator::FermionOperator;
 use qiskit_fermions_core::operators::{OperatorMacro, OperatorTrait};
 
 pub type PyFermionAction = (bool, u32);
 
+static FERMION_ACTION_TYPE: PyOnceLock<Py<PyType>> = PyOnceLock::new();
+
+/// Returns the Python ``FermionAction`` type.
+pub(crate) fn fermion_action_type(py: Python<'_>) -> PyResult<&Bound<'_, PyType>> {
+    FERMION_ACTION_TYPE.import(
+        py,
+        "qiskit_fermions.operators.fermion_action",
+        "FermionAction",
+    )
+}
+
+/// Extracts a fermionic action as it is accepted from Python.
+///
+/// This is either a ``FermionAction`` (i.e. an integer storing ``(mode << 1) | action``) or a
+/// plain ``(action, mode)`` tuple. Any other integer is rejected rather than being treated as a
+/// packed action, such that mistakes like a flat ``(action, mode)`` key do not pass silently.
+fn extract_fermion_action(action: &Bound<'_, PyAny>) -> PyResult<PyFermionAction> {
+    if action.is_instance_of::<PyTuple>() {
+        return action.extract();
+    }
+    if action.is_instance(fermion_action_type(action.py())?)? {
+        let packed = action.extract::<u32>()?;
+        return Ok((packed & 1 == 1, packed >> 1));
+    }
+    Err(PyTypeError::new_err(format!(
+        "expected a FermionAction or an (action, mode) tuple, got {}",
+        action.get_type().name()?
+    )))
+}
+
 #[gen_stub_pyclass]
 #[pyclass(
     module = "qiskit_fermions.operators.fermion_operator",
     name = "FermionOperatorDataIter"
 )]
 struct FermionOperatorDataIter {
-    inner: std::vec::IntoIter<(Vec<PyFermionAction>, Complex64)>,
+    // NOTE: the terms are extracted lazily from the operator, such that starting an iteration does
+    // not copy all of its terms up front.
+    operator: Py<PyFermionOperator>,
+    index: usize,
 }
 
 #[gen_stub_pymethods]
@@ -39,7 +79,21 @@ impl FermionOperatorDataIter {
     }
 
     fn __next__(mut slf: PyRefMut<'_, Self>) -> Option<(Vec<PyFermionAction>, Complex64)> {
-        slf.inner.next()
+        let index = slf.index;
+        let item = {
+            let operator = slf.operator.borrow(slf.py());
+            let op = &operator.inner;
+            if index >= op.coeffs.len() {
+                return None;
+            }
+            let (start, end) = (op.boundaries[index], op.boundaries[index + 1]);
+            let actions = zip(&op.actions[start..end], &op.indices[start..end])
+                .map(|(action, idx)| (*action, *idx))
+                .collect();
+            (actions, op.coeffs[index])
+        };
+        slf.index += 1;
+        Some(item)
     }
 }
 
@@ -145,6 +199,7 @@ impl FermionOperatorDataIter {
 ///
 /// .. autosummary::
 ///
+///    from_terms_arrays
 ///    zero
 ///    one
 ///
@@ -317,35 +372,82 @@ impl PyFermionOperator {
     ///
     /// Args:
     ///     data: a dictionary mapping tuples of terms to complex coefficients. Each key is a tuple
-    ///         of ``(bool, int)`` pairs. You may use :func:`.cre` and :func:`.ann` to simplify
-    ///         their construction.
+    ///         of :class:`.FermionAction` instances or plain ``(bool, int)`` pairs. You may use
+    ///         :func:`.cre` and :func:`.ann` to simplify their construction.
     ///
     /// Returns:
     ///     A new operator.
     #[classmethod]
-    fn from_dict(_cls: &Bound<'_, PyType>, data: HashMap<Vec<(bool, u32)>, Complex64>) -> Self {
-        let mut coeffs = vec![];
-        let mut actions = vec![];
-        let mut indices = vec![];
-        let mut boundaries = vec![0];
-
-        data.iter().for_each(|(terms, coeff)| {
-            coeffs.push(*coeff);
-            terms.iter().for_each(|(action, idx)| {
-                actions.push(*action);
-                indices.push(*idx);
-            });
+    fn from_dict(
+        _cls: &Bound<'_, PyType>,
+        #[gen_stub(override_type(
+            type_repr = "builtins.dict[typing.Sequence[tuple[builtins.bool, builtins.int]], builtins.complex]",
+            imports = ("builtins", "typing")
+        ))]
+        data: &Bound<'_, PyDict>,
+    ) -> PyResult<Self> {
+        // NOTE: the dictionary is iterated directly rather than being extracted into a native hash
+        // map first, which would hash every term once more just to iterate over it. The total
+        // number of actions is counted up front, such that all buffers get allocated exactly once.
+        let num_actions = data
+            .keys()
+            .iter()
+            .map(|term| term.len())
+            .sum::<PyResult<usize>>()?;
+        let mut coeffs = Vec::with_capacity(data.len());
+        let mut actions = Vec::with_capacity(num_actions);
+        let mut indices = Vec::with_capacity(num_actions);
+        let mut boundaries = Vec::with_capacity(data.len() + 1);
+        boundaries.push(0);
+
+        for (terms, coeff) in data.iter() {
+            coeffs.push(coeff.extract::<Complex64>()?);
+            for term in terms.try_iter()? {
+                let (action, idx) = extract_fermion_action(&term?)?;
+                actions.push(action);
+                indices.push(idx);
+            }
             boundaries.push(indices.len());
-        });
+        }
 
-        Self {
+        Ok(Self {
             inner: FermionOperator {
                 coeffs,
                 actions,
                 indices,
                 boundaries,
             },
+        })
+    }
+
+    /// Returns the operator as a dictionary.
+    ///
+    /// This is the inverse of :meth:`from_dict`. Each key is a tuple of ``(bool, int)`` pairs
+    /// which defines the actions of a term. The coefficients of repeated terms are summed up.
+    ///
+    /// .. doctest::
+    ///     >>> from qiskit_fermions.operators import FermionOperator
+    ///     >>> op = FermionOperator.from_dict({(): 1.0-1.0j, ((True, 0), (False, 1)): 2.0})
+    ///     >>> op.to_dict()
+    ///     {(): (1-1j), ((True, 0), (False, 1)): (2+0j)}
+    ///
+    /// Returns:
+    ///     A dictionary mapping the terms of this operator to their coefficients.
+    #[gen_stub(override_return_type(
+        type_repr = "builtins.dict[tuple[tuple[builtins.bool, builtins.int], ...], builtins.complex]",
+        imports = ("builtins")
+    ))]
+    fn to_dict<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        let dict = PyDict::new(py);
+        for term in self.inner.iter() {
+            let key = PyTuple::new(py, term.iter().map(|(action, index)| (*action, *index)))?;
+            let coeff = match dict.get_item(&key)? {
+                Some(prev) => prev.extract::<Complex64>()? + term.coeff,
+                None => term.coeff,
+            };
+            dict.set_item(key, coeff)?;
         }
+        Ok(dict)
     }
 
     fn __richcmp__(&self, other: &Self, op: CompareOp, _py: Python<'_>) -> PyResult<bool> {
@@ -393,22 +495,10 @@ impl PyFermionOperator {
     }
 
     fn __repr__(&self) -> PyResult<String> {
-        let mut items_str = Vec::new();
-        for term in self.inner.iter() {
-            let key_parts: Vec<String> = term
-                .iter()
-                .map(|(action, orb)| {
-                    format!("({}, {})", if *action { "True" } else { "False" }, orb)
-                })
-                .collect();
-            let key_str = format!("({})", key_parts.join(", "));
-            let val_str = format!("{}{:+}j", term.coeff.re, term.coeff.im);
-            items_str.push(format!("{key_str}: {val_str}"));
-        }
-        Ok(format!(
-            "FermionOperator.from_dict({{{}}})",
-            items_str.join(", ")
-        ))
+        let mut repr = String::new();
+        self.write_repr(&mut repr)
+            .expect("writing into a String cannot fail");
+        Ok(repr)
     }
 
     fn __str__(&self) -> PyResult<String> {
@@ -431,6 +521,9 @@ impl PyFermionOperator {
     ///
     /// Adding the operator that is constructed by this method to another one has no effect.
     ///
+    /// Since operators can be modified in-place (for example via :meth:`ichop` or ``+=``), every call
+    /// returns a new instance rather than a shared one.
+    ///
     /// .. doctest::
     ///     >>> from qiskit_fermions.operators import FermionOperator
     ///     >>> op = FermionOperator.from_dict({(): 2.0})
@@ -450,6 +543,9 @@ impl PyFermionOperator {
     ///
     /// Composing the operator that is constructed by this method with another one has no effect.
     ///
+    /// Since operators can be modified in-place (for example via :meth:`ichop` or ``+=``), every call
+    /// returns a new instance rather than a shared one.
+    ///
     /// .. doctest::
     ///     >>> from qiskit_fermions.operators import FermionOperator
     ///     >>> op = FermionOperator.from_dict({(): 2.0})
@@ -548,6 +644,10 @@ impl PyFermionOperator {
     /// .. warning::
     ///    Mutating the iteration items does **not** affect the underlying operator data.
     ///
+    /// The terms are extracted lazily, one at a time, as the iteration progresses. Therefore,
+    /// in-place modifications of the operator during an ongoing iteration are reflected by the
+    /// terms which have not been yielded yet.
+    ///
     /// .. doctest::
     ///     >>> from qiskit_fermions.operators import FermionOperator
     ///     >>> op = FermionOperator.from_dict({(): 2.0, ((True, 0),): 1.0, ((False, 1),): -1.0j})
@@ -556,15 +656,112 @@ impl PyFermionOperator {
     ///
     /// ..
     fn iter_terms(slf: PyRef<'_, Self>) -> PyResult<Py<FermionOperatorDataIter>> {
-        let vectorized: Vec<(Vec<PyFermionAction>, Complex64)> = slf
-            .inner
-            .iter()
-            .map(|term| (term.into_vec(), term.coeff))
-            .collect();
+        let py = slf.py();
         let iter = FermionOperatorDataIter {
-            inner: vectorized.into_iter(),
+            operator: slf.into(),
+            index: 0,
         };
-        Py::new(slf.py(), iter)
+        Py::new(py, iter)
+    }
+
+    /// Constructs a new operator directly from NumPy arrays.
+    ///
+    /// This takes the same arrays as the default constructor (see the class documentation), but
+    /// copies their contents in bulk rather than extracting them from Python one element at a
+    /// time. This makes it the preferred way of constructing large operators whose data is
+    /// already available as arrays.
+    ///
+    /// .. doctest::
+    ///     >>> import numpy as np
+    ///     >>> from qiskit_fermions.operators import FermionOperator
+    ///     >>> op = FermionOperator.from_terms_arrays(
+    ///     ...     np.array([1.0, 2.0]),
+    ///     ...     np.array([True, False]),
+    ///     ...     np.array([0, 1], dtype=np.uint32),
+    ///     ...     np.array([0, 0, 2]),
+    ///     ... )
+    ///     >>> print(op)
+    ///       1.000000e0 +0.000000e0j * ()
+    ///       2.000000e0 +0.000000e0j * (+_0 -_1)
+    ///
+    /// Args:
+    ///     coeffs: the coefficients. Arrays which are not of the ``complex128`` dtype (e.g. real
+    ///         coefficients) get cast to it.
+    ///     actions: the boolean actions.
+    ///     indices: the 32-bit unsigned integer mode indices.
+    ///     boundaries: the 64-bit integer term boundaries.
+    ///
+    /// Returns:
+    ///     A new operator.
+    ///
+    /// Raises:
+    ///     ValueError: if ``boundaries`` contains negative entries, does not start at ``0``,
+    ///         decreases, does not contain one more entry than ``coeffs`` or does not end at the
+    ///         length of ``actions`` and ``indices``.
+    #[classmethod]
+    fn from_terms_arrays(
+        _cls: &Bound<'_, PyType>,
+        #[gen_stub(override_type(type_repr = "numpy.typing.ArrayLike", imports = ("numpy.typing")))]
+        coeffs: &Bound<'_, PyAny>,
+        actions: PyReadonlyArray1<'_, bool>,
+        indices: PyReadonlyArray1<'_, u32>,
+        boundaries: PyReadonlyArray1<'_, i64>,
+    ) -> PyResult<Self> {
+        let coeffs = extract_coeffs_array(coeffs)?;
+        let actions = actions.as_array().to_vec();
+        let indices = indices.as_array().to_vec();
+        let boundaries = extract_boundaries_array(
+            boundaries,
+            coeffs.len(),
+            &[("actions", actions.len()), ("indices", indices.len())],
+        )?;
+
+        Ok(Self {
+            inner: FermionOperator {
+                coeffs,
+                actions,
+                indices,
+                boundaries,
+            },
+        })
+    }
+
+    /// Returns the operator data as packed NumPy arrays.
+    ///
+    /// This provides a flat view of the operator which is suitable for vectorized processing (see
+    /// also :func:`.map_fermion_packed_terms` and :meth:`.from_terms_arrays`). Contrary to
+    /// the arrays that define the operator (see the class documentation), the ``actions`` and
+    /// ``indices`` get packed into a single array of 64-bit integers, where each entry is given by
+    /// ``(index << 1) | action``.
+    ///
+    /// .. doctest::
+    ///     >>> from qiskit_fermions.operators import FermionOperator
+    ///     >>> op = FermionOperator([2.0, 1.0j], [True, False], [1, 0], [0, 0, 2])
+    ///     >>> coeffs, boundaries, packed = op.as_packed_arrays()
+    ///     >>> coeffs
+    ///     array([2.+0.j, 0.+1.j])
+    ///     >>> boundaries
+    ///     array([0, 0, 2])
+    ///     >>> packed
+    ///     array([3, 0], dtype=uint64)
+    ///
+    /// Returns:
+    ///     A tuple of the complex ``coeffs``, the 64-bit integer ``boundaries`` and the packed
+    ///     64-bit unsigned integer actions.
+    fn as_packed_arrays<'py>(
+        &self,
+        py: Python<'py>,
+    ) -> (
+        Bound<'py, PyArray1<Complex64>>,
+        Bound<'py, PyArray1<i64>>,
+        Bound<'py, PyArray1<u64>>,
+    ) {
+        let boundaries: Vec<i64> = self.inner.boundaries.iter().map(|b| *b as i64).collect();
+        (
+            PyArray1::from_slice(py, &self.inner.coeffs),
+            PyArray1::from_vec(py, boundaries),
+            PyArray1::from_vec(py, self.inner.packed_actions()),
+        )
     }
 
     /// Returns the Hermitian conjugate (or adjoint) of this operator.
@@ -635,11 +832,28 @@ impl PyFermionOperator {
     ///      -1.000000e0 +0.000000e0j * (+_1 -_1)
     ///      -1.000000e0 +0.000000e0j * (+_1 +_0 -_1 -_0)
     ///
+    /// Providing ``chop`` removes small terms while the operator gets normal-ordered. This is
+    /// equivalent to (but cheaper than) calling :meth:`ichop` on the returned operator. Note that
+    /// neither combines duplicate terms, which still requires :meth:`simplify`:
+    ///
+    /// .. doctest::
+    ///     >>> op = FermionOperator.from_dict({((False, 0), (True, 0)): 1, ((True, 1),): 1e-10})
+    ///     >>> print(op.normal_ordered(chop=1e-8))  # doctest: +FLOAT_CMP
+    ///       1.000000e0 +0.000000e0j * ()
+    ///      -1.000000e0 +0.000000e0j * (+_0 -_0)
+    ///
+    /// Args:
+    ///     chop: an optional absolute tolerance below which to remove terms from the result.
+    ///
     /// Returns:
     ///     An equivalent but normal-ordered operator.
-    fn normal_ordered(&self) -> Self {
+    #[pyo3(signature = (chop=None))]
+    fn normal_ordered(&self, chop: Option<f64>) -> Self {
         Self {
-            inner: self.inner.normal_ordered(),
+            inner: match chop {
+                Some(atol) => self.inner.normal_ordered_chopped(atol),
+                None => self.inner.normal_ordered(),
+            },
         }
     }
 
@@ -707,6 +921,69 @@ impl PyFermionOperator {
     fn conserves_particle_number(&self) -> bool {
         self.inner.conserves_particle_number()
     }
+
+    /// Splits the operator into groups of terms which act on the same set of modes.
+    ///
+    /// Each group is returned alongside its support, i.e. the sorted list of distinct indices of the
+    /// modes which its terms act upon. Within every group, the indices get relabeled by their
+    /// position in the support, such that each group acts on the modes ``0`` to
+    /// ``len(support) - 1`` only. For example, a group may then be mapped onto ``len(support)``
+    /// qubits (e.g. via :func:`.jordan_wigner`) independently of the total number of modes.
+    ///
+    /// .. doctest::
+    ///     >>> from qiskit_fermions.operators import FermionOperator
+    ///     >>> op = FermionOperator.from_dict(
+    ///     ...     {
+    ///     ...         ((True, 0), (False, 2)): 1.0,
+    ///     ...         ((True, 1), (False, 1)): 2.0,
+    ///     ...         ((True, 2), (False, 0)): 1.0,
+    ///     ...     }
+    ///     ... )
+    ///     >>> for support, group in op.split_by_support():
+    ///     ...     print(support)
+    ///     ...     print(group)
+    ///     [0, 2]
+    ///       1.000000e0 +0.000000e0j * (+_0 -_1)
+    ///       1.000000e0 +0.000000e0j * (+_1 -_0)
+    ///     [1]
+    ///       2.000000e0 +0.000000e0j * (+_0 -_0)
+    ///
+    /// Returns:
+    ///     A list of pairs of supports and the operators acting on them, ordered by the first
+    ///     occurrence of each support.
+    fn split_by_support(&self) -> Vec<(Vec<u32>, Self)> {
+        self.inner
+            .split_by_support()
+            .into_iter()
+            .map(|(support, inner)| (support, Self { inner }))
+            .collect()
+    }
+}
+
+impl PyFermionOperator {
+    /// Writes the representation of this operator into a single buffer, avoiding the intermediate
+    /// strings of formatting every term and action separately.
+    fn write_repr(&self, out: &mut String) -> fmt::Result {
+        out.push_str("FermionOperator.from_dict({");
+        for (i, term) in self.inner.iter().enumerate() {
+            if i > 0 {
+                out.push_str(", ");
+            }
+            out.push('(');
+            for (j, (action, orb)) in term.iter().enumerate() {
+                if j > 0 {
+                    out.push_str(", ");
+                }
+                write!(out, "({}, {orb})", if *action { "True" } else { "False" })?;
+            }
+            if term.actions.len() == 1 {
+                out.push(',');
+            }
+            write!(out, "): {}{:+}j", term.coeff.re, term.coeff.im)?;
+        }
+        out.push_str("})");
+        Ok(())
+    }
 }
 
 #[pymodule]
@@ -155,7 +155,9 @@ impl PyFermionOperator {
     /// Returns:
     ///     The constructed operator.
     #[classmethod]
-    fn from_fcidump(_cls: &Bound<'_, PyType>, fcidump: PyFCIDump) -> Self {
+    fn from_fcidump(_cls: &Bound<'_, PyType>, fcidump: PyRef<'_, PyFCIDump>) -> Self {
+        // NOTE: the FCIDump gets borrowed rather than extracted by value, since the latter would
+        // clone all of its (dense) integral arrays just to read them once.
         Self {
             inner: FermionOperator::from(&fcidump.inner),
         }
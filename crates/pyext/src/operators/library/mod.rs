@@ -15,6 +15,7 @@ use pyo3::prelude::*;
 mod commutators;
 mod electronic_integrals;
 pub mod fcidump;
+mod polynomial_tensor;
 
 #[pymodule]
 pub mod operators_library {
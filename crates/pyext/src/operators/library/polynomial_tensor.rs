@@ -0,0 +1,103 @@
+// This code is a Qiskit project.
+//
+// (C) Copyright IBM 2026.
+//
+// This code is licensed under the Apache License, Version 2.0. You may
+// obtain a copy of this license in the LICENSE.txt file in the root directory
+// of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+//
+// Any modifications or derivative works of this code must retain this
+// copyright notice, and modified files need to carry a notice indicating
+// that they have been altered from the originals.
+
+use crate::operators::fermion_operator::PyFermionOperator;
+use num_complex::Complex64;
+use numpy::PyReadonlyArrayDyn;
+use pyo3::exceptions::PyValueError;
+use pyo3::intern;
+use pyo3::prelude::*;
+use pyo3::types::{PyDict, PyType};
+use pyo3_stub_gen::derive::*;
+use qiskit_fermions_core::operators::OperatorTrait;
+use qiskit_fermions_core::operators::fermion_operator::FermionOperator;
+use qiskit_fermions_core::operators::library::polynomial_tensor::FromPolynomialTensor;
+
+#[gen_stub_pymethods]
+#[pymethods]
+impl PyFermionOperator {
+    /// Constructs an operator from dense tensors of coefficients.
+    ///
+    /// Each key of ``data`` is a label of ``+`` (creation) and ``-`` (annihilation) characters,
+    /// which defines the actions of the terms generated from the corresponding tensor. The tensor
+    /// must have one axis per action, such that for example the label ``"++--"`` defines the
+    /// operator
+    ///
+    /// .. math::
+    ///
+    ///     \sum_{ijkl} c_{ijkl} a^\dagger_i a^\dagger_j a_k a_l
+    ///
+    /// where :math:`c` is the 4-dimensional tensor stored under that label. The empty label
+    /// ``""`` may be used to provide a constant via a 0-dimensional tensor.
+    ///
+    /// Only the nonzero entries of every tensor generate a term. These get extracted natively from
+    /// the arrays, which avoids constructing any intermediate Python objects per term. Tensors
+    /// which are not ``complex128`` arrays yet (e.g. real-valued integrals) are cast via
+    /// ``numpy.asarray`` first.
+    ///
+    /// .. doctest::
+    ///    >>> import numpy as np
+    ///    >>> from qiskit_fermions.operators import FermionOperator
+    ///    >>> constant = np.array(0.5, dtype=complex)
+    ///    >>> one_body = np.array([[1.0, 2.0], [0.0, 3.0]], dtype=complex)
+    ///    >>> op = FermionOperator.from_polynomial_tensor({"": constant, "+-": one_body})
+    ///    >>> print(op)
+    ///     5.000000e-1 +0.000000e0j * ()
+    ///      1.000000e0 +0.000000e0j * (+_0 -_0)
+    ///      2.000000e0 +0.000000e0j * (+_0 -_1)
+    ///      3.000000e0 +0.000000e0j * (+_1 -_1)
+    ///
+    /// Args:
+    ///     data: a dictionary mapping action labels to array-like tensors with one axis per action.
+    ///
+    /// Returns:
+    ///     The sum of all terms generated from the provided tensors.
+    ///
+    /// Raises:
+    ///     ValueError: if a label contains characters other than ``+`` and ``-`` or if the number
+    ///         of dimensions of a tensor does not match the length of its label.
+    #[classmethod]
+    fn from_polynomial_tensor(
+        _cls: &Bound<'_, PyType>,
+        data: &Bound<'_, PyDict>,
+    ) -> PyResult<Self> {
+        let py = data.py();
+        let numpy = PyModule::import(py, intern!(py, "numpy"))?;
+        let mut op = FermionOperator::zero();
+        for (label, tensor) in data.iter() {
+            let label: String = label.extract()?;
+            let tensor =
+                numpy.call_method1(intern!(py, "asarray"), (tensor, intern!(py, "complex128")))?;
+            let tensor: PyReadonlyArrayDyn<Complex64> = tensor.extract()?;
+            let tensor = tensor.as_array();
+            let actions = label
+                .chars()
+                .map(|c| match c {
+                    '+' => Ok(true),
+                    '-' => Ok(false),
+                    _ => Err(PyValueError::new_err(format!(
+                        "invalid character '{c}' in the label '{label}'"
+                    ))),
+                })
+                .collect::<PyResult<Vec<_>>>()?;
+            if actions.len() != tensor.ndim() {
+                return Err(PyValueError::new_err(format!(
+                    "the label '{label}' requires a {}-dimensional tensor but got {} dimensions",
+                    actions.len(),
+                    tensor.ndim()
+                )));
+            }
+            op.add_dense_tensor(&actions, tensor);
+        }
+        Ok(Self { inner: op })
+    }
+}
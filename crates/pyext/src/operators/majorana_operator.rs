@@ -11,12 +11,17 @@
 // that they have been altered from the originals.
 
 use num_complex::Complex64;
+use numpy::PyReadonlyArray1;
 use pyo3::prelude::*;
-use pyo3::types::PyType;
-use pyo3::{class::basic::CompareOp, exceptions::PyNotImplementedError};
+use pyo3::types::{PyDict, PyTuple, PyType};
+use pyo3::{
+    class::basic::CompareOp,
+    exceptions::{PyNotImplementedError, PyOverflowError},
+};
 use pyo3_stub_gen::derive::*;
-use std::collections::HashMap;
+use std::fmt::{self, Write};
 
+use crate::operators::{extract_boundaries_array, extract_coeffs_array};
 use qiskit_fermions_core::operators::majorana_operator::MajoranaOperator;
 use qiskit_fermions_core::operators::{OperatorMacro, OperatorTrait};
 
@@ -28,7 +33,10 @@ pub type PyMajoranaAction = u32;
     name = "MajoranaOperatorDataIter"
 )]
 struct MajoranaOperatorDataIter {
-    inner: std::vec::IntoIter<(Vec<PyMajoranaAction>, Complex64)>,
+    // NOTE: the terms are extracted lazily from the operator, such that starting an iteration does
+    // not copy all of its terms up front.
+    operator: Py<PyMajoranaOperator>,
+    index: usize,
 }
 
 #[gen_stub_pymethods]
@@ -39,7 +47,18 @@ impl MajoranaOperatorDataIter {
     }
 
     fn __next__(mut slf: PyRefMut<'_, Self>) -> Option<(Vec<PyMajoranaAction>, Complex64)> {
-        slf.inner.next()
+        let index = slf.index;
+        let item = {
+            let operator = slf.operator.borrow(slf.py());
+            let op = &operator.inner;
+            if index >= op.coeffs.len() {
+                return None;
+            }
+            let (start, end) = (op.boundaries[index], op.boundaries[index + 1]);
+            (op.modes[start..end].to_vec(), op.coeffs[index])
+        };
+        slf.index += 1;
+        Some(item)
     }
 }
 
@@ -146,6 +165,7 @@ impl MajoranaOperatorDataIter {
 ///
 /// .. autosummary::
 ///
+///    from_terms_arrays
 ///    zero
 ///    one
 ///
@@ -319,26 +339,124 @@ impl PyMajoranaOperator {
     /// Returns:
     ///     A new operator.
     #[classmethod]
-    fn from_dict(_cls: &Bound<'_, PyType>, data: HashMap<Vec<u32>, Complex64>) -> Self {
-        let mut coeffs = vec![];
-        let mut modes = vec![];
-        let mut boundaries = vec![0];
-
-        data.iter().for_each(|(terms, coeff)| {
-            coeffs.push(*coeff);
-            terms.iter().for_each(|mode| {
-                modes.push(*mode);
-            });
+    fn from_dict(
+        _cls: &Bound<'_, PyType>,
+        #[gen_stub(override_type(
+            type_repr = "builtins.dict[typing.Sequence[builtins.int], builtins.complex]",
+            imports = ("builtins", "typing")
+        ))]
+        data: &Bound<'_, PyDict>,
+    ) -> PyResult<Self> {
+        // NOTE: the dictionary is iterated directly rather than being extracted into a native hash
+        // map first, which would hash every term once more just to iterate over it. The total
+        // number of modes is counted up front, such that all buffers get allocated exactly once.
+        let num_modes = data
+            .keys()
+            .iter()
+            .map(|term| term.len())
+            .sum::<PyResult<usize>>()?;
+        let mut coeffs = Vec::with_capacity(data.len());
+        let mut modes = Vec::with_capacity(num_modes);
+        let mut boundaries = Vec::with_capacity(data.len() + 1);
+        boundaries.push(0);
+
+        for (terms, coeff) in data.iter() {
+            coeffs.push(coeff.extract::<Complex64>()?);
+            modes.extend(terms.extract::<Vec<u32>>()?);
             boundaries.push(modes.len());
-        });
+        }
 
-        Self {
+        Ok(Self {
             inner: MajoranaOperator {
                 coeffs,
                 modes,
                 boundaries,
             },
+        })
+    }
+
+    /// Returns the operator as a dictionary.
+    ///
+    /// This is the inverse of :meth:`from_dict`. Each key is a tuple of integers which defines the
+    /// Majorana modes of a term. The coefficients of repeated terms are summed up.
+    ///
+    /// .. doctest::
+    ///     >>> from qiskit_fermions.operators import MajoranaOperator
+    ///     >>> op = MajoranaOperator.from_dict({(): 1.0-1.0j, (0, 1): 2.0})
+    ///     >>> op.to_dict()
+    ///     {(): (1-1j), (0, 1): (2+0j)}
+    ///
+    /// Returns:
+    ///     A dictionary mapping the terms of this operator to their coefficients.
+    #[gen_stub(override_return_type(
+        type_repr = "builtins.dict[tuple[builtins.int, ...], builtins.complex]",
+        imports = ("builtins")
+    ))]
+    fn to_dict<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        let dict = PyDict::new(py);
+        for term in self.inner.iter() {
+            let key = PyTuple::new(py, term.modes)?;
+            let coeff = match dict.get_item(&key)? {
+                Some(prev) => prev.extract::<Complex64>()? + term.coeff,
+                None => term.coeff,
+            };
+            dict.set_item(key, coeff)?;
         }
+        Ok(dict)
+    }
+
+    /// Constructs a new operator directly from NumPy arrays.
+    ///
+    /// This takes the same arrays as the default constructor (see the class documentation), but
+    /// copies their contents in bulk rather than extracting them from Python one element at a
+    /// time. This makes it the preferred way of constructing large operators whose data is
+    /// already available as arrays.
+    ///
+    /// .. doctest::
+    ///     >>> import numpy as np
+    ///     >>> from qiskit_fermions.operators import MajoranaOperator
+    ///     >>> op = MajoranaOperator.from_terms_arrays(
+    ///     ...     np.array([1.0, 2.0]),
+    ///     ...     np.array([0, 1], dtype=np.uint32),
+    ///     ...     np.array([0, 0, 2]),
+    ///     ... )
+    ///     >>> print(op)
+    ///       1.000000e0 +0.000000e0j * ()
+    ///       2.000000e0 +0.000000e0j * (0 1)
+    ///
+    /// Args:
+    ///     coeffs: the coefficients. Arrays which are not of the ``complex128`` dtype (e.g. real
+    ///         coefficients) get cast to it.
+    ///     modes: the 32-bit unsigned integer Majorana mode indices.
+    ///     boundaries: the 64-bit integer term boundaries.
+    ///
+    /// Returns:
+    ///     A new operator.
+    ///
+    /// Raises:
+    ///     ValueError: if ``boundaries`` contains negative entries, does not start at ``0``,
+    ///         decreases, does not contain one more entry than ``coeffs`` or does not end at the
+    ///         length of ``modes``.
+    #[classmethod]
+    fn from_terms_arrays(
+        _cls: &Bound<'_, PyType>,
+        #[gen_stub(override_type(type_repr = "numpy.typing.ArrayLike", imports = ("numpy.typing")))]
+        coeffs: &Bound<'_, PyAny>,
+        modes: PyReadonlyArray1<'_, u32>,
+        boundaries: PyReadonlyArray1<'_, i64>,
+    ) -> PyResult<Self> {
+        let coeffs = extract_coeffs_array(coeffs)?;
+        let modes = modes.as_array().to_vec();
+        let boundaries =
+            extract_boundaries_array(boundaries, coeffs.len(), &[("modes", modes.len())])?;
+
+        Ok(Self {
+            inner: MajoranaOperator {
+                coeffs,
+                modes,
+                boundaries,
+            },
+        })
     }
 
     fn __richcmp__(&self, other: &Self, op: CompareOp, _py: Python<'_>) -> PyResult<bool> {
@@ -378,22 +496,10 @@ impl PyMajoranaOperator {
     }
 
     fn __repr__(&self) -> PyResult<String> {
-        let mut items_str = Vec::new();
-        for term in self.inner.iter() {
-            let key_parts: Vec<String> = term.iter().map(|mode| format!("{mode}")).collect();
-            // TODO: find a cleaner way to handle a 1-length tuple
-            let key_str = if key_parts.len() == 1 {
-                format!("({},)", key_parts.join(", "))
-            } else {
-                format!("({})", key_parts.join(", "))
-            };
-            let val_str = format!("{}{:+}j", term.coeff.re, term.coeff.im);
-            items_str.push(format!("{key_str}: {val_str}"));
-        }
-        Ok(format!(
-            "MajoranaOperator.from_dict({{{}}})",
-            items_str.join(", ")
-        ))
+        let mut repr = String::new();
+        self.write_repr(&mut repr)
+            .expect("writing into a String cannot fail");
+        Ok(repr)
     }
 
     fn __str__(&self) -> PyResult<String> {
@@ -413,6 +519,9 @@ impl PyMajoranaOperator {
     ///
     /// Adding the operator that is constructed by this method to another one has no effect.
     ///
+    /// Since operators can be modified in-place (for example via :meth:`ichop` or ``+=``), every call
+    /// returns a new instance rather than a shared one.
+    ///
     /// .. doctest::
     ///     >>> from qiskit_fermions.operators import MajoranaOperator
     ///     >>> op = MajoranaOperator.from_dict({(): 2.0})
@@ -432,6 +541,9 @@ impl PyMajoranaOperator {
     ///
     /// Composing the operator that is constructed by this method with another one has no effect.
     ///
+    /// Since operators can be modified in-place (for example via :meth:`ichop` or ``+=``), every call
+    /// returns a new instance rather than a shared one.
+    ///
     /// .. doctest::
     ///     >>> from qiskit_fermions.operators import MajoranaOperator
     ///     >>> op = MajoranaOperator.from_dict({(): 2.0})
@@ -530,6 +642,10 @@ impl PyMajoranaOperator {
     /// .. warning::
     ///    Mutating the iteration items does **not** affect the underlying operator data.
     ///
+    /// The terms are extracted lazily, one at a time, as the iteration progresses. Therefore,
+    /// in-place modifications of the operator during an ongoing iteration are reflected by the
+    /// terms which have not been yielded yet.
+    ///
     /// .. doctest::
     ///     >>> from qiskit_fermions.operators import MajoranaOperator
     ///     >>> op = MajoranaOperator.from_dict({(): 2.0, (0,): 1.0, (1,): -1.0j})
@@ -538,15 +654,12 @@ impl PyMajoranaOperator {
     ///
     /// ..
     fn iter_terms(slf: PyRef<'_, Self>) -> PyResult<Py<MajoranaOperatorDataIter>> {
-        let vectorized: Vec<(Vec<PyMajoranaAction>, Complex64)> = slf
-            .inner
-            .iter()
-            .map(|term| (term.into_vec(), term.coeff))
-            .collect();
+        let py = slf.py();
         let iter = MajoranaOperatorDataIter {
-            inner: vectorized.into_iter(),
+            operator: slf.into(),
+            index: 0,
         };
-        Py::new(slf.py(), iter)
+        Py::new(py, iter)
     }
 
     /// Returns the Hermitian conjugate (or adjoint) of this operator.
@@ -693,8 +806,84 @@ impl PyMajoranaOperator {
     }
 }
 
+impl PyMajoranaOperator {
+    /// Writes the representation of this operator into a single buffer, avoiding the intermediate
+    /// strings of formatting every term and mode separately.
+    fn write_repr(&self, out: &mut String) -> fmt::Result {
+        out.push_str("MajoranaOperator.from_dict({");
+        for (i, term) in self.inner.iter().enumerate() {
+            if i > 0 {
+                out.push_str(", ");
+            }
+            out.push('(');
+            for (j, mode) in term.modes.iter().enumerate() {
+                if j > 0 {
+                    out.push_str(", ");
+                }
+                write!(out, "{mode}")?;
+            }
+            if term.modes.len() == 1 {
+                out.push(',');
+            }
+            write!(out, "): {}{:+}j", term.coeff.re, term.coeff.im)?;
+        }
+        out.push_str("})");
+        Ok(())
+    }
+}
+
+/// Create a majorana fermion.
+///
+/// For a given mode ``i``, two majorana fermions can be created:
+///     - ``gamma(i, False)`` creates :math:`\gamma = a_i^\dagger + a_i`
+///     - ``gamma(i, True)`` creates :math:`\gamma' = i(a_i^\dagger - a_i)`
+///
+/// The argument order is ``(mode, is_prime)`` to reflect the natural interpretation of
+/// majorana operators: first specify the mode, then the variant. Unlike fermionic operators --
+/// where the distinction between creation and annihilation is fundamental -- the two majorana
+/// variants are more symmetric and conceptually less different.
+///
+/// This mirrors the normal-ordering convention for majoranas, where operators are sorted first by
+/// mode and then by variant. For example, a normally ordered string like
+/// ``((1, True), (0, False), (0, True)`` is more readable and intuitive than
+/// ``((True, 1), (False, 0), (True, 0)``.
+///
+/// .. doctest::
+///     >>> from qiskit_fermions.operators import gamma
+///     >>> gamma(0, False), gamma(0, True), gamma(3, True)
+///     (0, 1, 7)
+///
+/// Args:
+///     mode: index of the fermionic mode.
+///     is_prime: whether to create :math:`\gamma` (False) or :math:`\gamma'` (True). Any value
+///         with a truth value (e.g. ``0`` or ``1``) is accepted.
+///
+/// Returns:
+///     A ``MajoranaAction`` object, which is essentially the flat index ``2*mode+int(is_prime)``.
+///
+/// Raises:
+///     OverflowError: if the flat index does not fit into 32 bits.
+#[gen_stub_pyfunction(module = "qiskit_fermions.operators.majorana_operator")]
+#[pyfunction]
+#[gen_stub(override_return_type(type_repr="qiskit_fermions.operators.majorana_action.MajoranaAction", imports=("qiskit_fermions.operators.majorana_action")))]
+pub fn gamma(
+    mode: u32,
+    #[gen_stub(override_type(type_repr = "builtins.bool", imports = ("builtins")))]
+    is_prime: &Bound<'_, PyAny>,
+) -> PyResult<u32> {
+    let Some(index) = mode.checked_mul(2) else {
+        return Err(PyOverflowError::new_err(format!(
+            "mode {mode} is too large for a majorana action"
+        )));
+    };
+    Ok(index | is_prime.is_truthy()? as u32)
+}
+
 #[pymodule]
 pub mod majorana_operator {
     #[pymodule_export]
     use super::PyMajoranaOperator;
+
+    #[pymodule_export]
+    use super::gamma;
 }
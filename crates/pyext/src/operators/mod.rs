@@ -10,8 +10,68 @@
 // copyright notice, and modified files need to carry a notice indicating
 // that they have been altered from the originals.
 
+use num_complex::Complex64;
+use numpy::PyReadonlyArray1;
+use pyo3::exceptions::PyValueError;
+use pyo3::intern;
 use pyo3::prelude::*;
 
+/// Extracts a 1-dimensional array of complex coefficients.
+///
+/// NumPy arrays do not get converted between dtypes implicitly. Thus, any input which is not
+/// already a ``complex128`` array (e.g. real coefficients) is cast via ``numpy.asarray`` first.
+pub(crate) fn extract_coeffs_array(coeffs: &Bound<'_, PyAny>) -> PyResult<Vec<Complex64>> {
+    if let Ok(coeffs) = coeffs.extract::<PyReadonlyArray1<'_, Complex64>>() {
+        return Ok(coeffs.as_array().to_vec());
+    }
+    let py = coeffs.py();
+    let coeffs = PyModule::import(py, intern!(py, "numpy"))?
+        .call_method1(intern!(py, "asarray"), (coeffs, intern!(py, "complex128")))?;
+    Ok(coeffs
+        .extract::<PyReadonlyArray1<'_, Complex64>>()?
+        .as_array()
+        .to_vec())
+}
+
+/// Converts the term boundaries of an operator constructed from arrays and validates them.
+///
+/// The boundaries must start at ``0``, must not decrease, must provide one term per coefficient
+/// and must end at the length of every one of the provided per-action ``arrays``.
+pub(crate) fn extract_boundaries_array(
+    boundaries: PyReadonlyArray1<'_, i64>,
+    num_coeffs: usize,
+    arrays: &[(&str, usize)],
+) -> PyResult<Vec<usize>> {
+    let boundaries = boundaries
+        .as_array()
+        .iter()
+        .map(|b| usize::try_from(*b))
+        .collect::<Result<Vec<_>, _>>()
+        .map_err(|_| PyValueError::new_err("boundaries must not be negative"))?;
+    if boundaries.len() != num_coeffs + 1 {
+        return Err(PyValueError::new_err(format!(
+            "expected {} boundaries for {num_coeffs} coefficients but got {}",
+            num_coeffs + 1,
+            boundaries.len()
+        )));
+    }
+    if boundaries[0] != 0 {
+        return Err(PyValueError::new_err("the first boundary must be 0"));
+    }
+    if !boundaries.is_sorted() {
+        return Err(PyValueError::new_err("boundaries must not decrease"));
+    }
+    let last = boundaries[num_coeffs];
+    for (name, len) in arrays {
+        if *len != last {
+            return Err(PyValueError::new_err(format!(
+                "the last boundary ({last}) does not match the length of {name} ({len})"
+            )));
+        }
+    }
+    Ok(boundaries)
+}
+
 #[macro_export]
 macro_rules! impl_operator_magic_methods {
     ($name:ty) => {
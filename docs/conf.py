@@ -14,16 +14,20 @@ import os
 import sys
 from importlib.metadata import version as metadata_version
 
-# The following line is required for autodoc to be able to find and import the code whose API should
-# be documented.
-sys.path.insert(0, os.path.abspath(".."))
+# The following lines are required for autodoc to be able to find and import the code whose API
+# should be documented.
+_root = os.path.abspath("..")
+if _root not in sys.path:
+    sys.path.insert(0, _root)
 
 project = "Qiskit Fermions"
 project_copyright = "2025, Qiskit addons team"
 description = "Qiskit for Fermions"
 author = "Qiskit addons team"
 language = "en"
-release = metadata_version("qiskit-fermions")
+# The version may be provided via the environment (see `make docs`) to avoid scanning the installed
+# package metadata every time this file gets imported.
+release = os.environ.get("QISKIT_FERMIONS_VERSION") or metadata_version("qiskit-fermions")
 
 html_theme = "qiskit-ecosystem"
 
@@ -52,14 +56,11 @@ extensions = [
     "sphinx.ext.autosummary",
     "sphinx.ext.doctest",
     "sphinx.ext.mathjax",
-    "sphinx.ext.linkcode",
     "sphinx.ext.intersphinx",
-    "matplotlib.sphinxext.plot_directive",
     "sphinx_copybutton",
     "sphinx_reredirects",
     "reno.sphinxext",
     "sphinx_design",
-    "nbsphinx",
     "qiskit_sphinx_theme",
     "pytest_doctestplus.sphinx.doctestplus",
     "sphinxcontrib.katex",
@@ -102,9 +103,6 @@ napoleon_numpy_docstring = False
 numfig = True
 numfig_format = {"table": "Table %s"}
 
-# Settings for Jupyter notebooks.
-nbsphinx_execute = "never"
-
 add_module_names = False
 
 modindex_common_prefix = ["qiskit_fermions."]
@@ -115,9 +113,6 @@ intersphinx_mapping = {
     "cqiskit": ("https://quantum.cloud.ibm.com/docs/api/qiskit-c/", None),
 }
 
-plot_working_directory = "."
-plot_html_show_source_link = False
-
 # ----------------------------------------------------------------------------------
 # Redirects
 # ----------------------------------------------------------------------------------
@@ -131,11 +126,3 @@ redirects = {
         for module, name in _inlined_apis
     },
 }
-
-# ----------------------------------------------------------------------------------
-# Source code links
-# ----------------------------------------------------------------------------------
-
-
-def linkcode_resolve(domain, info):
-    return None
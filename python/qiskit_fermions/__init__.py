@@ -18,17 +18,22 @@
 
 import sys
 from inspect import ismodule
+from types import ModuleType
 
 from . import _lib  # type: ignore[attr-defined]
 
-__modules = {_lib: "qiskit_fermions._lib"}
-
-while len(__modules):
-    for __module, __path in __modules.copy().items():
-        for __submodule_name in __module.__all__:
-            __submodule = getattr(__module, __submodule_name)
-            __submodule_path = f"{__path}.{__submodule_name}"
-            if ismodule(__submodule):
-                __modules[__submodule] = __submodule_path
-                sys.modules[__submodule_path] = __submodule
-        del __modules[__module]
+
+def _register(module: ModuleType, path: str, seen: set[int]) -> None:
+    for submodule_name in module.__all__:
+        submodule = getattr(module, submodule_name)
+        if ismodule(submodule) and id(submodule) not in seen:
+            seen.add(id(submodule))
+            submodule_path = f"{path}.{submodule_name}"
+            sys.modules[submodule_path] = submodule
+            # NOTE: the name is only resolved at call time, before it gets deleted below
+            _register(submodule, submodule_path, seen)  # noqa: F821
+
+
+_register(_lib, "qiskit_fermions._lib", set())
+
+del _register
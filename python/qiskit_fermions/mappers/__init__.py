@@ -27,13 +27,25 @@ This module provides a framework for implementing custom representation mapper r
    :toctree: ../stubs/
 
    map_fermion_action_generators
+   map_fermion_packed_terms
    map_majorana_action_generators
+
+Output types of these mappers can implement the :class:`.SupportsFastCompose`
+:py:class:`~typing.Protocol` to provide their fastest composition primitive.
+
+.. autosummary::
+   :toctree: ../stubs/
+
+   SupportsFastCompose
 """
 
-from .fermion_generators import map_fermion_action_generators
+from .fermion_generators import map_fermion_action_generators, map_fermion_packed_terms
 from .majorana_generators import map_majorana_action_generators
+from .protocols import SupportsFastCompose
 
 __all__ = [
+    "SupportsFastCompose",
     "map_fermion_action_generators",
+    "map_fermion_packed_terms",
     "map_majorana_action_generators",
 ]
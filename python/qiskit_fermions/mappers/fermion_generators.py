@@ -14,7 +14,17 @@
 
 from collections.abc import Callable
 from operator import and_
-from typing import TypeVar
+from typing import TypeVar, cast
+
+import numpy as np
+from numpy.typing import NDArray
+
+from qiskit_fermions._lib.mappers.generators import (
+    map_fermion_action_generators as _map_fermion_action_generators,
+)
+from qiskit_fermions._lib.mappers.generators import (
+    map_fermion_packed_terms as _map_fermion_packed_terms,
+)
 
 from ..operators import FermionAction, FermionOperator
 
@@ -26,6 +36,13 @@ def map_fermion_action_generators(
     map_action: Callable[[FermionAction], T],
     identity: Callable[[], T],
     compose: Callable[[T, T], T] | None = None,
+    *,
+    cache: bool = True,
+    zero: Callable[[], T] | None = None,
+    batch_sum: Callable[[list[T]], T] | None = None,
+    tree_reduce: bool = False,
+    group_by_coeff: bool = False,
+    fresh_identity: bool = False,
 ) -> T:
     """Map a :class:`.FermionOperator` to another operator type.
 
@@ -33,11 +50,13 @@ def map_fermion_action_generators(
     instances. At its core, it simply iterates over the terms of the operator, mapping each
     encountered :class:`.FermionAction` with the user-provided ``map_action`` function. In
     combination with the user-provided ``identity`` generator, this allows mapping to arbitrary
-    output types.
+    output types. The iteration over the terms is performed natively, such that Python is only
+    invoked for the user-provided callables and the arithmetic of the output type.
 
     .. note::
        The output type ``T`` must support multiplication by a scalar via ``__mul__``.
-       If ``compose=None`` it must also support composition of two instances via ``__and__``.
+       If ``compose=None`` it must also support composition of two instances via ``__and__`` or
+       implement :class:`.SupportsFastCompose`.
 
     .. doctest::
         >>> from qiskit_fermions.mappers import map_fermion_action_generators
@@ -68,22 +87,125 @@ def map_fermion_action_generators(
         operator: the operator to be mapped.
         map_action: the function to map a single :class:`.FermionAction` to the desired output type.
         identity: the function to generate the multiplicative identity instance of the output type.
+            Unless ``fresh_identity=True``, this gets called only once and the returned instance is
+            shared among all terms.
         compose: an optional function to implement the compositiion logic of two output type
-            instances. If this is not provided, it will default to using :py:func:`operator.and_`.
+            instances. If this is not provided, it will default to the ``_compose_`` method of
+            output types implementing :class:`.SupportsFastCompose` and to using
+            :py:func:`operator.and_` otherwise.
+        cache: whether to cache the outputs of ``map_action``. Since the same actions generally
+            occur in many terms of an operator, this avoids the repeated construction of identical
+            output instances. The cache is keyed natively on the integer representation of the
+            actions, such that cache hits do not call into Python. This requires ``map_action`` to
+            be pure (i.e. its output may only depend on the provided :class:`.FermionAction`) and
+            ``compose`` to not mutate its inputs in-place.
+        zero: an optional function to generate the additive identity (i.e. the zero) instance of
+            the output type. If this is not provided, it gets constructed as ``0 * identity()``,
+            which may waste the construction of a full identity instance. For example, users
+            mapping to a :class:`~qiskit.quantum_info.SparsePauliOp` may provide
+            ``lambda: SparsePauliOp.from_sparse_list([], num_qubits)`` here.
+        batch_sum: an optional function to sum up a list of output type instances at once. If this
+            is provided, all scaled terms are collected first and summed up with a single call of
+            this function (the zero instance is always included as the first item). Otherwise, the
+            terms are accumulated one after another via ``+=``, which may repeatedly reallocate
+            the growing output instance. For example, users mapping to a
+            :class:`~qiskit.quantum_info.SparsePauliOp` may provide ``SparsePauliOp.sum`` here.
+        tree_reduce: whether to compose the mapped actions of each term pairwise (i.e. as a
+            balanced tree) rather than one after another. For output types whose size grows with
+            every composition this avoids the construction of large intermediate instances, which
+            mostly pays off for terms with many actions. This requires ``compose`` to be
+            associative and may change the numerical result within floating point precision.
+        group_by_coeff: whether to sum up all mapped terms which share the same coefficient before
+            scaling them. Physical operators often contain many terms with identical coefficients,
+            in which case this replaces one scalar multiplication per term by one per distinct
+            coefficient. This may change the numerical result within floating point precision.
+        fresh_identity: whether to call ``identity`` anew for every term rather than sharing a
+            single instance. This is only required when ``compose`` mutates its inputs in-place.
 
     Returns:
         The mapped operator.
     """
-    if compose is None:
-        compose = and_
+    if compose is and_:
+        # NOTE: the default composition gets dispatched to `__and__` natively, skipping the call of
+        # `operator.and_` for every pair of composed actions.
+        compose = None
+
+    return cast(
+        T,
+        _map_fermion_action_generators(
+            operator,
+            map_action,
+            identity,
+            compose,
+            cache=cache,
+            zero=zero,
+            batch_sum=batch_sum,
+            tree_reduce=tree_reduce,
+            group_by_coeff=group_by_coeff,
+            fresh_identity=fresh_identity,
+        ),
+    )
 
-    mapped_operator: T = 0 * identity()  # type: ignore[assignment,operator]
-    for terms, coeff in operator.iter_terms():
-        mapped_terms = identity()
 
-        for term in terms:
-            mapped_terms = compose(map_action(term), mapped_terms)
+def map_fermion_packed_terms(
+    operator: FermionOperator,
+    map_term: Callable[[NDArray[np.uint64]], T],
+    identity: Callable[[], T],
+    *,
+    zero: Callable[[], T] | None = None,
+) -> T:
+    """Map a :class:`.FermionOperator` to another operator type one term at a time.
 
-        mapped_operator += coeff * mapped_terms
+    This is a vectorized alternative to :func:`.map_fermion_action_generators`. Rather than mapping
+    each :class:`.FermionAction` individually and composing the results, ``map_term`` is called
+    exactly once per term of the operator. It gets provided with a read-only NumPy view of the
+    packed actions of that term (see :meth:`.FermionOperator.as_packed_arrays`), where each entry
+    is given by ``(index << 1) | action``. This allows ``map_term`` to process all actions of a term
+    using array operations and avoids the Python call overhead of composing individual actions.
+
+    .. doctest::
+        >>> from qiskit_fermions.mappers import map_fermion_packed_terms
+        >>> from qiskit_fermions.operators import FermionOperator, ann, cre
+        >>>
+        >>> def map_term(packed):
+        ...     actions = (packed & 1).astype(bool).tolist()
+        ...     indices = (packed >> 1).tolist()
+        ...     return FermionOperator([1.0], actions, indices, [0, len(indices)])
+        >>>
+        >>> op = FermionOperator.from_dict({(cre(0), ann(1)): 2.0})
+        >>> mapped = map_fermion_packed_terms(op, map_term, FermionOperator.one)
+        >>> mapped.equiv(op)
+        True
 
-    return mapped_operator
+    .. note::
+       When the mapped output of an entire operator can be represented by NumPy arrays, even the
+       per-term Python calls can be avoided by operating on the arrays returned by
+       :meth:`.FermionOperator.as_packed_arrays` directly. Kernels written against these arrays are
+       also amenable to JIT compilation (e.g. with Numba). For example, the change in particle
+       number caused by every term can be computed like so (note that reductions which are based
+       on ``boundaries[:-1]`` alone, such as :py:obj:`numpy.add.reduceat`, do not handle empty
+       terms correctly):
+
+       .. doctest::
+           >>> import numpy as np
+           >>> op = FermionOperator(
+           ...     [0.5, 2.0, 1.0], [True, False, True, True], [0, 1, 0, 1], [0, 0, 2, 4]
+           ... )
+           >>> coeffs, boundaries, packed = op.as_packed_arrays()
+           >>> signs = 2 * (packed & 1).astype(np.int64) - 1
+           >>> terms = np.repeat(np.arange(len(coeffs)), np.diff(boundaries))
+           >>> np.bincount(terms, weights=signs, minlength=len(coeffs)).astype(np.int64)
+           array([0, 0, 2])
+
+    Args:
+        operator: the operator to be mapped.
+        map_term: the function to map the packed actions of a single term to the desired output
+            type.
+        identity: the function to generate the multiplicative identity instance of the output type.
+        zero: an optional function to generate the additive identity (i.e. the zero) instance of
+            the output type. See :func:`.map_fermion_action_generators` for more details.
+
+    Returns:
+        The mapped operator.
+    """
+    return cast(T, _map_fermion_packed_terms(operator, map_term, identity, zero))
@@ -14,7 +14,11 @@
 
 from collections.abc import Callable
 from operator import and_
-from typing import TypeVar
+from typing import TypeVar, cast
+
+from qiskit_fermions._lib.mappers.generators import (
+    map_majorana_action_generators as _map_majorana_action_generators,
+)
 
 from ..operators import MajoranaAction, MajoranaOperator
 
@@ -26,6 +30,13 @@ def map_majorana_action_generators(
     map_action: Callable[[MajoranaAction], T],
     identity: Callable[[], T],
     compose: Callable[[T, T], T] | None = None,
+    *,
+    cache: bool = True,
+    zero: Callable[[], T] | None = None,
+    batch_sum: Callable[[list[T]], T] | None = None,
+    tree_reduce: bool = False,
+    group_by_coeff: bool = False,
+    fresh_identity: bool = False,
 ) -> T:
     """Map a :class:`.MajoranaOperator` to another operator type.
 
@@ -33,11 +44,13 @@ def map_majorana_action_generators(
     instances. At its core, it simply iterates over the terms of the operator, mapping each
     encountered :class:`.MajoranaAction` with the user-provided ``map_action`` function. In
     combination with the user-provided ``identity`` generator, this allows mapping to arbitrary
-    output types.
+    output types. The iteration over the terms is performed natively, such that Python is only
+    invoked for the user-provided callables and the arithmetic of the output type.
 
     .. note::
        The output type ``T`` must support multiplication by a scalar via ``__mul__``.
-       If ``compose=None`` it must also support composition of two instances via ``__and__``.
+       If ``compose=None`` it must also support composition of two instances via ``__and__`` or
+       implement :class:`.SupportsFastCompose`.
 
     .. doctest::
         >>> from qiskit_fermions.mappers import map_majorana_action_generators
@@ -45,9 +58,9 @@ def map_majorana_action_generators(
         >>> from qiskit.quantum_info import SparsePauliOp
         >>>
         >>> def jordan_wigner(mode: MajoranaAction) -> SparsePauliOp:
-        ...     idx = mode // 2
+        ...     idx = mode >> 1
         ...     qubits = list(range(idx + 1))
-        ...     pauli = "Y" if mode % 2 else "X"
+        ...     pauli = "Y" if mode & 1 else "X"
         ...     return SparsePauliOp.from_sparse_list(
         ...         [("Z" * idx + pauli, qubits, 1.0)],
         ...         num_qubits=num_qubits,
@@ -71,25 +84,64 @@ def map_majorana_action_generators(
         operator: the operator to be mapped.
         map_action: the function to map a single :class:`.MajoranaAction` to the desired output type.
         identity: the function to generate the multiplicative identity instance of the output type.
+            Unless ``fresh_identity=True``, this gets called only once and the returned instance is
+            shared among all terms.
         compose: an optional function to implement the compositiion logic of two output type
-            instances. If this is not provided, it will default to using :py:func:`operator.and_`.
+            instances. If this is not provided, it will default to the ``_compose_`` method of
+            output types implementing :class:`.SupportsFastCompose` and to using
+            :py:func:`operator.and_` otherwise.
+        cache: whether to cache the outputs of ``map_action``. Since the same actions generally
+            occur in many terms of an operator, this avoids the repeated construction of identical
+            output instances. The cache is keyed natively on the integer representation of the
+            actions, such that cache hits do not call into Python. This requires ``map_action`` to
+            be pure (i.e. its output may only depend on the provided :class:`.MajoranaAction`) and
+            ``compose`` to not mutate its inputs in-place.
+        zero: an optional function to generate the additive identity (i.e. the zero) instance of
+            the output type. If this is not provided, it gets constructed as ``0 * identity()``,
+            which may waste the construction of a full identity instance. For example, users
+            mapping to a :class:`~qiskit.quantum_info.SparsePauliOp` may provide
+            ``lambda: SparsePauliOp.from_sparse_list([], num_qubits)`` here.
+        batch_sum: an optional function to sum up a list of output type instances at once. If this
+            is provided, all scaled terms are collected first and summed up with a single call of
+            this function (the zero instance is always included as the first item). Otherwise, the
+            terms are accumulated one after another via ``+=``, which may repeatedly reallocate
+            the growing output instance. For example, users mapping to a
+            :class:`~qiskit.quantum_info.SparsePauliOp` may provide ``SparsePauliOp.sum`` here.
+        tree_reduce: whether to compose the mapped actions of each term pairwise (i.e. as a
+            balanced tree) rather than one after another. For output types whose size grows with
+            every composition this avoids the construction of large intermediate instances, which
+            mostly pays off for terms with many actions. This requires ``compose`` to be
+            associative and may change the numerical result within floating point precision.
+        group_by_coeff: whether to sum up all mapped terms which share the same coefficient before
+            scaling them. Physical operators often contain many terms with identical coefficients,
+            in which case this replaces one scalar multiplication per term by one per distinct
+            coefficient. This may change the numerical result within floating point precision.
+        fresh_identity: whether to call ``identity`` anew for every term rather than sharing a
+            single instance. This is only required when ``compose`` mutates its inputs in-place.
 
     Returns:
         The mapped operator.
     """
-    if compose is None:
-        compose = and_
-
-    mapped_operator: T = 0 * identity()  # type: ignore[assignment,operator]
-    for terms, coeff in operator.iter_terms():
-        mapped_terms = identity()
-
-        for term in terms:
-            mapped_terms = compose(map_action(term), mapped_terms)
-
-        mapped_operator += coeff * mapped_terms
-
-    return mapped_operator
+    if compose is and_:
+        # NOTE: the default composition gets dispatched to `__and__` natively, skipping the call of
+        # `operator.and_` for every pair of composed actions.
+        compose = None
+
+    return cast(
+        T,
+        _map_majorana_action_generators(
+            operator,
+            map_action,
+            identity,
+            compose,
+            cache=cache,
+            zero=zero,
+            batch_sum=batch_sum,
+            tree_reduce=tree_reduce,
+            group_by_coeff=group_by_coeff,
+            fresh_identity=fresh_identity,
+        ),
+    )
 
 
 # TODO: map_majorana_even_generators
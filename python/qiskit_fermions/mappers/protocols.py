@@ -0,0 +1,40 @@
+# This code is a Qiskit project.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+
+"""Mapper protocols."""
+
+from typing import Protocol, TypeVar, runtime_checkable
+
+T = TypeVar("T")
+
+
+@runtime_checkable
+class SupportsFastCompose(Protocol[T]):
+    """A runtime-checkable Protocol indicating support for efficient composition.
+
+    Output types of the generic mappers (like :func:`.map_fermion_action_generators`) may implement
+    this protocol to provide their fastest composition primitive. When no ``compose`` function is
+    provided to a mapper, it will use this method instead of falling back to ``__and__``.
+
+    .. automethod:: _compose_
+    """
+
+    @staticmethod
+    def _compose_(op_a: T, op_b: T) -> T:
+        """Composes two operator instances.
+
+        This must be equivalent to ``op_a & op_b``. For example, a subclass of
+        :class:`~qiskit.quantum_info.SparsePauliOp` may implement this as
+        ``op_b.compose(op_a, front=True)``.
+        """
+        ...
@@ -13,7 +13,8 @@
 """The FermionAction type."""
 
 import sys
-from typing import NamedTuple
+from collections.abc import Iterator
+from functools import cache
 
 if sys.version_info >= (3, 11):
     from typing import Self
@@ -21,14 +22,68 @@ else:
     from typing_extensions import Self
 
 
-class FermionAction(NamedTuple):
-    """A fermionic creation or annihilation action."""
+class FermionAction(int):
+    """A fermionic creation or annihilation action.
 
-    action: bool
-    """Whether this action is a creation (``True``) or annihilation (``False``) one."""
+    The action is stored as a single integer given by ``(mode << 1) | action``. This makes instances
+    of this class cheap to store and to hash, and matches the packed representation returned by
+    :meth:`.FermionOperator.as_packed_arrays`.
 
-    mode: int
-    """The spin-less fermionic mode index on which to act."""
+    .. note::
+       Instances of this class still support unpacking into their ``(action, mode)`` pair. However,
+       contrary to a tuple, they compare equal to their packed integer value only.
+
+    .. doctest::
+        >>> from qiskit_fermions.operators import FermionAction
+        >>> act = FermionAction(True, 2)
+        >>> act
+        FermionAction(action=True, mode=2)
+        >>> int(act)
+        5
+        >>> action, mode = act
+        >>> action, mode
+        (True, 2)
+        >>> match act:
+        ...     case FermionAction(True, mode):
+        ...         print(f"creation on mode {mode}")
+        creation on mode 2
+    """
+
+    __slots__ = ()
+
+    __match_args__ = ("action", "mode")
+
+    def __new__(cls, action: bool, mode: int) -> Self:
+        """Constructs a new action.
+
+        Args:
+            action: whether this action is a creation (``True``) or annihilation (``False``) one.
+            mode: the spin-less fermionic mode index on which to act.
+        """
+        return super().__new__(cls, (mode << 1) | bool(action))
+
+    def __getnewargs__(self) -> tuple[bool, int]:  # type: ignore[override]
+        """Returns the arguments required to reconstruct this action (e.g. when unpickling)."""
+        return (self.action, self.mode)
+
+    def __iter__(self) -> Iterator[bool | int]:
+        """Iterates the ``(action, mode)`` pair, supporting the unpacking of this action."""
+        yield self.action
+        yield self.mode
+
+    def __repr__(self) -> str:
+        """Returns the representation of this action."""
+        return f"{type(self).__name__}(action={self.action}, mode={self.mode})"
+
+    @property
+    def action(self) -> bool:
+        """Whether this action is a creation (``True``) or annihilation (``False``) one."""
+        return bool(self & 1)
+
+    @property
+    def mode(self) -> int:
+        """The spin-less fermionic mode index on which to act."""
+        return int(self) >> 1
 
     @classmethod
     def creation(cls, mode: int) -> Self:
@@ -37,7 +92,7 @@ class FermionAction(NamedTuple):
         Args:
             mode: the spin-less fermionic mode on which to act.
         """
-        return cls(action=True, mode=mode)
+        return cls(True, mode)
 
     @classmethod
     def annihilation(cls, mode: int) -> Self:
@@ -46,11 +101,30 @@ class FermionAction(NamedTuple):
         Args:
             mode: the spin-less fermionic mode on which to act.
         """
-        return cls(action=False, mode=mode)
+        return cls(False, mode)
+
+
+@cache
+def cre(mode: int) -> FermionAction:
+    """A convenience alias for :meth:`FermionAction.creation`.
+
+    Since actions are immutable, the constructed instances are cached such that repeated calls for
+    the same ``mode`` (e.g. when writing out the terms of an operator) return the same instance.
+
+    Args:
+        mode: the spin-less fermionic mode on which to act.
+    """
+    return FermionAction.creation(mode)
+
 
+@cache
+def ann(mode: int) -> FermionAction:
+    """A convenience alias for :meth:`FermionAction.annihilation`.
 
-cre = FermionAction.creation
-"""A convenience alias for :meth:`FermionAction.creation`."""
+    Since actions are immutable, the constructed instances are cached such that repeated calls for
+    the same ``mode`` (e.g. when writing out the terms of an operator) return the same instance.
 
-ann = FermionAction.annihilation
-"""A convenience alias for :meth:`FermionAction.annihilation`."""
+    Args:
+        mode: the spin-less fermionic mode on which to act.
+    """
+    return FermionAction.annihilation(mode)
@@ -71,6 +71,14 @@ Hamiltonians as an input. Different flavors exist:
    :meth:`.FermionOperator.from_2body_tril_spin`     Constructs from separate spin triangular 2-body integrals.
    ================================================= ===========================================================
 
+* Arbitrary Terms
+
+.. table::
+
+   =============================================== ===============================================
+   :meth:`.FermionOperator.from_polynomial_tensor` Constructs from ``full`` tensors of any order.
+   =============================================== ===============================================
+
 Other Generators
 ----------------
 
@@ -12,35 +12,15 @@
 
 """The MajoranaAction type."""
 
-from typing import NewType, cast
+from typing import NewType
 
+from qiskit_fermions._lib.operators.majorana_operator import gamma
+
+# NOTE: a NewType (rather than a TypeAlias of int) keeps MajoranaAction distinct from plain integers
+# during static type checking. At runtime it is never called: gamma is implemented natively and
+# returns plain integers, which its type stub annotates as MajoranaAction.
 MajoranaAction = NewType("MajoranaAction", int)
 
 MajoranaAction.__doc__ = """The MajoranaAction type. See :func:`.gamma` for more details."""
 
-
-def gamma(mode: int, is_prime: bool) -> MajoranaAction:
-    r"""Create a majorana fermion.
-
-    For a given mode ``i``, two majorana fermions can be created:
-        - ``gamma(i, False)`` creates :math:`\gamma = a_i^\dagger + a_i`
-        - ``gamma(i, True)`` creates :math:`\gamma' = i(a_i^\dagger - a_i)`
-
-    The argument order is ``(mode, is_prime)`` to reflect the natural interpretation of
-    majorana operators: first specify the mode, then the variant. Unlike fermionic operators --
-    where the distinction between creation and annihilation is fundamental -- the two majorana
-    variants are more symmetric and conceptually less different.
-
-    This mirrors the normal-ordering convention for majoranas, where operators are sorted first by
-    mode and then by variant. For example, a normally ordered string like
-    ``((1, True), (0, False), (0, True)`` is more readable and intuitive than
-    ``((True, 1), (False, 0), (True, 0)``.
-
-    Args:
-        mode: index of the fermionic mode.
-        is_prime: whether to create :math:`\gamma` (False) or :math:`\gamma'` (True).
-
-    Returns:
-        A ``MajoranaAction`` object, which is essentially the flat index ``2*mode+int(is_prime)``.
-    """
-    return cast(MajoranaAction, 2 * mode + int(is_prime))
+__all__ = ["MajoranaAction", "gamma"]
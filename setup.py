@@ -26,11 +26,15 @@ from setuptools_rust import Binding, RustExtension
 # unergonomic to do otherwise.
 
 
-# If RUST_DEBUG is set, force compiling in debug mode. Else, use the default behavior of whether
-# it's an editable installation.
-rust_debug = True if os.getenv("RUST_DEBUG") == "1" else None
+# If RUST_DEBUG is set, force compiling in debug mode. Else, always compile in release mode (even
+# for editable installations), since debug builds of the Rust components are significantly slower.
+rust_debug = os.getenv("RUST_DEBUG") == "1"
 
-features = []
+# If QISKIT_FERMIONS_NATIVE is set, optimize the Rust components for the CPU of the building
+# machine. The resulting library is not portable and must not be distributed.
+rustc_flags = ["-Ctarget-cpu=native"] if os.getenv("QISKIT_FERMIONS_NATIVE") == "1" else []
+
+features = ["rayon"]
 
 
 setup(
@@ -41,6 +45,7 @@ setup(
             binding=Binding.PyO3,
             debug=rust_debug,
             features=features,
+            rustc_flags=rustc_flags,
         )
     ],
     options={"bdist_wheel": {"py_limited_api": "cp310"}},
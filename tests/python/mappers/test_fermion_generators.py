@@ -10,26 +10,70 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
+from collections import Counter
 from functools import cache
+from operator import and_
+from typing import Any
 
+import numpy as np
+from numpy.typing import NDArray
 from qiskit.quantum_info import SparsePauliOp
-from qiskit_fermions.mappers import map_fermion_action_generators
-from qiskit_fermions.operators import FermionAction, FermionOperator
+from qiskit_fermions.mappers import (
+    SupportsFastCompose,
+    map_fermion_action_generators,
+    map_fermion_packed_terms,
+)
+from qiskit_fermions.operators import FermionAction, FermionOperator, ann
 
 
-def jordan_wigner(op: FermionOperator, layout: dict[int, int]) -> SparsePauliOp:
+@cache
+def _identity(num_qubits: int) -> SparsePauliOp:
+    """Returns the (shared) identity operator on ``num_qubits`` qubits."""
+    return SparsePauliOp.from_sparse_list([("", [], 1)], num_qubits=num_qubits)
+
+
+class CountingMapper:
+    """Maps every action onto an operator of that single action and counts all callbacks."""
+
+    def __init__(self) -> None:
+        self.actions: Counter[FermionAction] = Counter()
+        self.calls: Counter[str] = Counter()
+
+    def map_action(self, action: FermionAction) -> FermionOperator:
+        assert isinstance(action, FermionAction)
+        self.actions[action] += 1
+        return FermionOperator.from_dict({(action,): 1.0})
+
+    def identity(self) -> FermionOperator:
+        self.calls["identity"] += 1
+        return FermionOperator.one()
+
+    def zero(self) -> FermionOperator:
+        self.calls["zero"] += 1
+        return FermionOperator.zero()
+
+    def compose(self, left: FermionOperator, right: FermionOperator) -> FermionOperator:
+        self.calls["compose"] += 1
+        return left & right
+
+
+def jordan_wigner(op: FermionOperator, layout: dict[int, int], **kwargs: Any) -> SparsePauliOp:
     """Custom Jordan-Wigner transformation."""
     num_qubits = max(layout.values()) + 1
+    # NOTE: the Pauli labels, qubits and coefficients of all modes are tabulated up front, such that
+    # mapping an action reduces to a few lookups.
+    x_labels = ["Z" * idx + "X" for idx in range(num_qubits)]
+    y_labels = ["Z" * idx + "Y" for idx in range(num_qubits)]
+    qubit_lists = [list(range(idx + 1)) for idx in range(num_qubits)]
+    y_coeffs = (0.5j, -0.5j)
 
-    @cache
     def map_action(action: FermionAction) -> SparsePauliOp:
         act, idx = action
         idx = layout[idx]
-        qubits = list(range(idx + 1))
         return SparsePauliOp.from_sparse_list(
             [
-                ("Z" * idx + "X", qubits, 0.5),
-                ("Z" * idx + "Y", qubits, -0.5j if act else 0.5j),
+                (x_labels[idx], qubit_lists[idx], 0.5),
+                (y_labels[idx], qubit_lists[idx], y_coeffs[act]),
             ],
             num_qubits=num_qubits,
         )
@@ -37,7 +81,8 @@ def jordan_wigner(op: FermionOperator, layout: dict[int, int]) -> SparsePauliOp:
     return map_fermion_action_generators(
         op,
         map_action,
-        lambda: SparsePauliOp.from_sparse_list([("", [], 1)], num_qubits=num_qubits),
+        lambda: _identity(num_qubits),
+        **kwargs,
     )
 
 
@@ -84,5 +129,158 @@ def test_jordan_wigner():
         ],
         num_qubits,
     )
-    diff = (qop - expected).simplify()
-    assert diff == SparsePauliOp.from_sparse_list([], num_qubits)
+    assert qop.equiv(expected)
+
+
+def test_cache():
+    op = FermionOperator.from_dict(
+        {
+            ((True, 0), (False, 0)): 1.0,
+            ((True, 1), (False, 0)): 2.0,
+        }
+    )
+    for cache_, num_calls in ((True, 1), (False, 2)):
+        mapper = CountingMapper()
+        mapped = map_fermion_action_generators(
+            op, mapper.map_action, FermionOperator.one, cache=cache_
+        )
+        assert mapped.equiv(op)
+        assert mapper.actions[ann(0)] == num_calls
+
+
+def test_packed_terms():
+    op = FermionOperator.from_dict(
+        {
+            (): 0.5,
+            ((True, 0), (False, 0)): 1.0,
+            ((True, 1), (False, 0)): 2.0,
+        }
+    )
+
+    def map_term(packed: NDArray[np.uint64]) -> FermionOperator:
+        assert not packed.flags.writeable
+        actions = (packed & 1).astype(bool).tolist()
+        indices = (packed >> 1).tolist()
+        return FermionOperator([1.0], actions, indices, [0, len(indices)])
+
+    mapped = map_fermion_packed_terms(op, map_term, FermionOperator.one)
+    assert mapped.equiv(op)
+
+
+def test_zero():
+    op = FermionOperator.from_dict({((True, 1), (False, 0)): 2.0})
+    mapper = CountingMapper()
+    mapped = map_fermion_action_generators(op, mapper.map_action, mapper.identity, zero=mapper.zero)
+    assert mapped.equiv(op)
+    assert mapper.calls == {"zero": 1, "identity": 1}
+
+
+def test_tree_reduce():
+    op = FermionOperator.from_dict(
+        {
+            (): 0.5,
+            ((True, 0),): 1.0,
+            ((True, 0), (True, 1), (False, 2)): 2.0,
+            ((True, 0), (True, 1), (False, 2), (False, 3)): 3.0,
+            ((True, 3), (True, 2), (True, 1), (False, 2), (False, 0)): 4.0,
+        }
+    )
+    mapper = CountingMapper()
+    mapped = map_fermion_action_generators(
+        op, mapper.map_action, FermionOperator.one, tree_reduce=True
+    )
+    assert mapped.equiv(op)
+
+
+def test_group_by_coeff():
+    op = FermionOperator.from_dict(
+        {
+            ((True, 0), (False, 0)): 1.0,
+            ((True, 1), (False, 1)): 1.0,
+            ((True, 0), (False, 1)): 0.5j,
+            ((True, 1), (False, 0)): -0.5j,
+            ((True, 2), (False, 2)): 1.0,
+        }
+    )
+    mapper = CountingMapper()
+    mapped = map_fermion_action_generators(
+        op, mapper.map_action, FermionOperator.one, zero=mapper.zero, group_by_coeff=True
+    )
+    assert mapped.equiv(op)
+    assert mapper.calls["zero"] == 4
+
+
+def test_compose():
+    op = FermionOperator.from_dict({((True, 1), (False, 0)): 2.0})
+    mapper = CountingMapper()
+    for compose_ in (None, and_, mapper.compose):
+        mapped = map_fermion_action_generators(op, mapper.map_action, FermionOperator.one, compose_)
+        assert mapped.equiv(op)
+    assert mapper.calls["compose"] == 2
+
+
+def test_fresh_identity():
+    op = FermionOperator.from_dict(
+        {(): 0.5, ((True, 0), (False, 0)): 1.0, ((True, 1), (False, 0)): 2.0}
+    )
+    for fresh_identity, num_calls in ((False, 1), (True, 4)):
+        mapper = CountingMapper()
+        mapped = map_fermion_action_generators(
+            op, mapper.map_action, mapper.identity, fresh_identity=fresh_identity
+        )
+        assert mapped.equiv(op)
+        assert mapper.calls["identity"] == num_calls
+
+
+def test_fast_compose():
+    op = FermionOperator.from_dict({((True, 0), (False, 1)): 2.0})
+    calls: Counter[str] = Counter()
+
+    class FastSparsePauliOp(SparsePauliOp):
+        @staticmethod
+        def _compose_(op_a: SparsePauliOp, op_b: SparsePauliOp) -> SparsePauliOp:
+            calls["compose"] += 1
+            return op_b.compose(op_a, front=True)
+
+    def map_action(action: FermionAction) -> SparsePauliOp:
+        act, idx = action
+        qubits = list(range(idx + 1))
+        return SparsePauliOp.from_sparse_list(
+            [
+                ("Z" * idx + "X", qubits, 0.5),
+                ("Z" * idx + "Y", qubits, -0.5j if act else 0.5j),
+            ],
+            num_qubits=2,
+        )
+
+    def identity() -> SparsePauliOp:
+        return FastSparsePauliOp(_identity(2))
+
+    assert isinstance(identity(), SupportsFastCompose)
+
+    qop = map_fermion_action_generators(op, map_action, identity)
+    assert calls["compose"] == 2
+    expected = jordan_wigner(op, {0: 0, 1: 1})
+    assert qop.equiv(expected)
+
+
+def test_batch_sum():
+    op = FermionOperator.from_dict(
+        {
+            (): 0.5,
+            ((True, 0), (False, 1)): 1.0,
+            ((True, 1), (False, 0)): 1.0,
+            ((True, 2), (False, 2)): 2.0,
+        }
+    )
+    calls: Counter[str] = Counter()
+
+    def batch_sum(ops: list[SparsePauliOp]) -> SparsePauliOp:
+        calls["batch_sum"] += 1
+        assert len(ops) == 5
+        return SparsePauliOp.sum(ops)
+
+    expected = jordan_wigner(op, {0: 0, 1: 1, 2: 2})
+    qop = jordan_wigner(op, {0: 0, 1: 1, 2: 2}, batch_sum=batch_sum)
+    assert calls["batch_sum"] == 1
+    assert qop.equiv(expected)
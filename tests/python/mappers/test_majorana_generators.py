@@ -10,30 +10,59 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
+from collections import Counter
 from functools import cache
+from typing import Any
 
 from qiskit.quantum_info import SparsePauliOp
 from qiskit_fermions.mappers import map_majorana_action_generators
 from qiskit_fermions.operators import MajoranaAction, MajoranaOperator
 
 
-def jordan_wigner(op: MajoranaOperator, num_qubits: int) -> SparsePauliOp:
+@cache
+def _identity(num_qubits: int) -> SparsePauliOp:
+    """Returns the (shared) identity operator on ``num_qubits`` qubits."""
+    return SparsePauliOp.from_sparse_list([("", [], 1)], num_qubits=num_qubits)
+
+
+class CountingMapper:
+    """Maps every action onto an operator of that single action and counts all callbacks."""
+
+    def __init__(self) -> None:
+        self.actions: Counter[MajoranaAction] = Counter()
+        self.calls: Counter[str] = Counter()
+
+    def map_action(self, mode: MajoranaAction) -> MajoranaOperator:
+        self.actions[mode] += 1
+        return MajoranaOperator.from_dict({(mode,): 1.0})
+
+    def identity(self) -> MajoranaOperator:
+        self.calls["identity"] += 1
+        return MajoranaOperator.one()
+
+    def zero(self) -> MajoranaOperator:
+        self.calls["zero"] += 1
+        return MajoranaOperator.zero()
+
+
+def jordan_wigner(op: MajoranaOperator, num_qubits: int, **kwargs: Any) -> SparsePauliOp:
     """Custom Jordan-Wigner transformation."""
+    # NOTE: the Pauli labels and qubits of all Majorana modes are tabulated up front, such that
+    # mapping an action reduces to two lookups.
+    labels = ["Z" * (mode >> 1) + ("Y" if mode & 1 else "X") for mode in range(2 * num_qubits)]
+    qubit_lists = [list(range((mode >> 1) + 1)) for mode in range(2 * num_qubits)]
 
-    @cache
     def map_action(mode: MajoranaAction) -> SparsePauliOp:
-        idx = mode // 2
-        qubits = list(range(idx + 1))
-        pauli = "Y" if mode % 2 else "X"
         return SparsePauliOp.from_sparse_list(
-            [("Z" * idx + pauli, qubits, 1.0)],
+            [(labels[mode], qubit_lists[mode], 1.0)],
             num_qubits=num_qubits,
         )
 
     return map_majorana_action_generators(
         op,
         map_action,
-        lambda: SparsePauliOp.from_sparse_list([("", [], 1)], num_qubits=num_qubits),
+        lambda: _identity(num_qubits),
+        **kwargs,
     )
 
 
@@ -80,5 +109,74 @@ def test_jordan_wigner():
         ],
         num_qubits,
     )
-    diff = (qop - expected).simplify()
-    assert diff == SparsePauliOp.from_sparse_list([], num_qubits)
+    assert qop.equiv(expected)
+
+
+def test_cache():
+    op = MajoranaOperator.from_dict({(1, 0): 1.0, (2, 0): 2.0})
+    for cache_, num_calls in ((True, 1), (False, 2)):
+        mapper = CountingMapper()
+        mapped = map_majorana_action_generators(
+            op, mapper.map_action, MajoranaOperator.one, cache=cache_
+        )
+        assert mapped.equiv(op)
+        assert mapper.actions[0] == num_calls
+
+
+def test_zero():
+    op = MajoranaOperator.from_dict({(2, 0): 2.0})
+    mapper = CountingMapper()
+    mapped = map_majorana_action_generators(
+        op, mapper.map_action, mapper.identity, zero=mapper.zero
+    )
+    assert mapped.equiv(op)
+    assert mapper.calls == {"zero": 1, "identity": 1}
+
+
+def test_tree_reduce():
+    op = MajoranaOperator.from_dict(
+        {(): 0.5, (0,): 1.0, (2, 1, 0): 2.0, (3, 1, 2, 0): 3.0, (4, 3, 1, 2, 0): 4.0}
+    )
+    mapper = CountingMapper()
+    mapped = map_majorana_action_generators(
+        op, mapper.map_action, MajoranaOperator.one, tree_reduce=True
+    )
+    assert mapped.equiv(op)
+
+
+def test_group_by_coeff():
+    op = MajoranaOperator.from_dict(
+        {(0, 1): 1.0, (2, 3): 1.0, (0, 3): 0.5j, (1, 2): -0.5j, (4, 5): 1.0}
+    )
+    mapper = CountingMapper()
+    mapped = map_majorana_action_generators(
+        op, mapper.map_action, MajoranaOperator.one, zero=mapper.zero, group_by_coeff=True
+    )
+    assert mapped.equiv(op)
+    assert mapper.calls["zero"] == 4
+
+
+def test_fresh_identity():
+    op = MajoranaOperator.from_dict({(): 0.5, (1, 0): 1.0, (2, 0): 2.0})
+    for fresh_identity, num_calls in ((False, 1), (True, 4)):
+        mapper = CountingMapper()
+        mapped = map_majorana_action_generators(
+            op, mapper.map_action, mapper.identity, fresh_identity=fresh_identity
+        )
+        assert mapped.equiv(op)
+        assert mapper.calls["identity"] == num_calls
+
+
+def test_batch_sum():
+    op = MajoranaOperator.from_dict({(): 0.5, (0, 3): 1.0j, (1, 2): -1.0j, (5, 4): 2.0j})
+    calls: Counter[str] = Counter()
+
+    def batch_sum(ops: list[SparsePauliOp]) -> SparsePauliOp:
+        calls["batch_sum"] += 1
+        assert len(ops) == 5
+        return SparsePauliOp.sum(ops)
+
+    expected = jordan_wigner(op, 3)
+    qop = jordan_wigner(op, 3, batch_sum=batch_sum)
+    assert calls["batch_sum"] == 1
+    assert qop.equiv(expected)
@@ -24,8 +24,7 @@ def test_commutator():
     op2 = FermionOperator.from_dict({((False, 0), (True, 0)): 2})
     assert isinstance(op1, SupportsCommutators)
     comm = commutator(op1, op2)
-    canon = comm.normal_ordered()
-    canon.ichop()
+    canon = comm.normal_ordered(chop=1e-8)
     assert canon.equiv(FermionOperator.zero())
 
 
@@ -34,8 +33,7 @@ def test_anti_commutator():
     op2 = FermionOperator.from_dict({((False, 0), (True, 0)): 2})
     assert isinstance(op1, SupportsCommutators)
     comm = anti_commutator(op1, op2)
-    canon = comm.normal_ordered()
-    canon.ichop()
+    canon = comm.normal_ordered(chop=1e-8)
     assert canon.equiv(FermionOperator.zero())
 
 
@@ -45,6 +43,5 @@ def test_double_commutator():
     op3 = FermionOperator.from_dict({((True, 0), (False, 0)): 1, ((False, 0), (True, 0)): 2 + 0.5j})
     assert isinstance(op1, SupportsCommutators)
     comm = double_commutator(op1, op2, op3, False)
-    canon = comm.normal_ordered()
-    canon.ichop()
+    canon = comm.normal_ordered(chop=1e-8)
     assert canon.equiv(FermionOperator.zero())
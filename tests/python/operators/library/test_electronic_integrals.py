@@ -11,6 +11,7 @@
 # that they have been altered from the originals.
 
 import numpy as np
+import pytest
 from qiskit_fermions.operators import FermionOperator
 
 
@@ -203,3 +204,41 @@ def test_from_2body_tril_spin():
         }
     )
     assert op.equiv(expected)
+
+
+def test_from_polynomial_tensor():
+    one_body = np.array([[1.0, 2.0], [0.0, 3.0]], dtype=complex)
+    two_body = np.zeros((2, 2, 2, 2), dtype=complex)
+    two_body[0, 1, 1, 0] = 0.5j
+    op = FermionOperator.from_polynomial_tensor(
+        {"": np.array(0.5, dtype=complex), "+-": one_body, "++--": two_body}
+    )
+    expected = FermionOperator.from_dict(
+        {
+            (): 0.5,
+            ((True, 0), (False, 0)): 1.0,
+            ((True, 0), (False, 1)): 2.0,
+            ((True, 1), (False, 1)): 3.0,
+            ((True, 0), (True, 1), (False, 1), (False, 0)): 0.5j,
+        }
+    )
+    assert op.equiv(expected)
+    with pytest.raises(ValueError):
+        FermionOperator.from_polynomial_tensor({"+x": one_body})
+    with pytest.raises(ValueError):
+        FermionOperator.from_polynomial_tensor({"+-+": one_body})
+
+
+def test_from_polynomial_tensor_real():
+    one_body = np.array([[1.0, 2.0], [0.0, 3.0]])
+    two_body = np.zeros((2, 2, 2, 2))
+    two_body[0, 1, 1, 0] = 0.5
+    op = FermionOperator.from_polynomial_tensor({"": 0.5, "+-": one_body, "++--": two_body})
+    expected = FermionOperator.from_polynomial_tensor(
+        {
+            "": np.array(0.5, dtype=complex),
+            "+-": one_body.astype(complex),
+            "++--": two_body.astype(complex),
+        }
+    )
+    assert op.equiv(expected)
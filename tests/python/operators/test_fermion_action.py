@@ -0,0 +1,56 @@
+# This code is a Qiskit project.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+
+import pickle
+
+from qiskit_fermions.operators import FermionAction, FermionOperator, ann, cre
+
+
+def test_packing():
+    assert cre(3) == FermionAction(True, 3) == 7
+    assert ann(3) == FermionAction(False, 3) == 6
+    assert cre(3).action
+    assert not ann(3).action
+    assert cre(3).mode == ann(3).mode == 3
+
+
+def test_cached():
+    assert cre(3) is cre(3)
+    assert ann(3) is ann(3)
+    assert cre(3) is not ann(3)
+
+
+def test_unpacking():
+    action, mode = cre(2)
+    assert action is True
+    assert mode == 2
+
+
+def test_pickle():
+    act = ann(5)
+    assert pickle.loads(pickle.dumps(act)) == act
+    assert isinstance(pickle.loads(pickle.dumps(act)), FermionAction)
+
+
+def test_from_dict():
+    op = FermionOperator.from_dict({(cre(0), ann(1)): 1.0})
+    assert op.equiv(FermionOperator.from_dict({((True, 0), (False, 1)): 1.0}))
+
+
+def test_match():
+    match ann(4):
+        case FermionAction(action, mode):
+            assert action is False
+            assert mode == 4
+        case _:
+            raise AssertionError("unreachable")
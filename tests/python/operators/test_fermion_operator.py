@@ -12,6 +12,8 @@
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+import pytest
 from qiskit_fermions.operators import FermionOperator, ann, cre
 from qiskit_fermions.operators.library import anti_commutator, commutator
 
@@ -25,11 +27,15 @@ class FermionOperatorTests(ABC):
         cls = self.get_class()
         op = cls.zero()
         assert op == cls.from_dict({})
+        op += cls.one()
+        assert cls.zero() == cls.from_dict({})
 
     def test_one(self):
         cls = self.get_class()
         op = cls.one()
         assert op == cls.from_dict({(): 1})
+        op *= 2
+        assert cls.one() == cls.from_dict({(): 1})
 
     def test_repr(self):
         cls = self.get_class()
@@ -40,10 +46,30 @@ class FermionOperatorTests(ABC):
                 (cre(2), ann(1)): 0.5,
                 (cre(3), ann(4)): -0.5j,
                 (cre(4), ann(3)): 1 - 0.5j,
+                (cre(5),): 3,
             }
         )
         assert op.equiv(eval(repr(op)))
 
+    def test_from_dict_actions(self, subtests):
+        cls = self.get_class()
+        with subtests.test("mixed action types"):
+            op = cls.from_dict({((True, 0), ann(1)): 1})
+            assert op.equiv(cls.from_dict({(cre(0), ann(1)): 1}))
+        with subtests.test("flat pair"), pytest.raises(TypeError):
+            cls.from_dict({(True, 0): 1})
+        with subtests.test("bare int"), pytest.raises(TypeError):
+            cls.from_dict({(5,): 1})
+
+    def test_to_dict(self):
+        cls = self.get_class()
+        data = {(): 2, ((True, 1), (False, 2)): 1, ((True, 3),): -0.5j}
+        op = cls.from_dict(data)
+        assert op.to_dict() == data
+        assert cls.from_dict(op.to_dict()).equiv(op)
+        op += cls.from_dict({(): 1})
+        assert op.to_dict() == {**data, (): 3}
+
     def test_len(self, subtests):
         cls = self.get_class()
 
@@ -61,6 +87,10 @@ class FermionOperatorTests(ABC):
         cls = self.get_class()
         op = cls.one()
         assert list(op.iter_terms()) == [([], 1)]
+        op = cls([1, 2, 3], [True, False], [0, 1], [0, 0, 1, 2])
+        terms = op.iter_terms()
+        assert next(terms) == ([], 1)
+        assert list(terms) == [([(True, 0)], 2), ([(False, 1)], 3)]
 
     def test_ichop(self):
         cls = self.get_class()
@@ -70,6 +100,10 @@ class FermionOperatorTests(ABC):
         op.ichop(1e-5)
         assert op.equiv(cls.from_dict({(): 1e-4}))
 
+        op = cls.from_dict({((True, 0),): 1e-10, ((False, 1),): 2j, ((True, 1),): 1 - 1j})
+        op.ichop()
+        assert op.equiv(cls.from_dict({((False, 1),): 2j, ((True, 1),): 1 - 1j}))
+
     def test_simplify(self):
         cls = self.get_class()
         coeffs = [1e-10, 2, 3, 4, -4]
@@ -200,11 +234,40 @@ class FermionOperatorTests(ABC):
         with subtests.test("pow==2"):
             assert (op**2).equiv(cls.from_dict({(cre(0), cre(0)): 4}))
 
+        with subtests.test("pow==5"):
+            assert (op**5).equiv(cls.from_dict({(cre(0),) * 5: 32}))
+
     def test_adjoint(self):
         cls = self.get_class()
         op = cls.from_dict({(): 2j, (cre(0), ann(1)): 3})
         assert op.adjoint().equiv(cls.from_dict({(): -2j, (cre(1), ann(0)): 3}))
 
+    def test_as_packed_arrays(self):
+        cls = self.get_class()
+        op = cls([2.0, 1j], [True, False, True], [1, 0, 3], [0, 0, 3])
+        coeffs, boundaries, packed = op.as_packed_arrays()
+        assert coeffs.tolist() == [2.0, 1j]
+        assert boundaries.tolist() == [0, 0, 3]
+        assert packed.tolist() == [3, 0, 7]
+
+    def test_from_terms_arrays(self):
+        cls = self.get_class()
+        op = cls([2.0, 1j], [True, False, True], [1, 0, 3], [0, 0, 3])
+        coeffs, boundaries, packed = op.as_packed_arrays()
+        actions = (packed & 1).astype(bool)
+        indices = (packed >> 1).astype(np.uint32)
+        new = cls.from_terms_arrays(coeffs, actions, indices, boundaries)
+        assert new == op
+        with pytest.raises(ValueError):
+            cls.from_terms_arrays(coeffs, actions, indices, -boundaries)
+
+        real = cls.from_terms_arrays(coeffs.real, actions, indices, boundaries)
+        assert real == cls([2.0, 0.0], [True, False, True], [1, 0, 3], [0, 0, 3])
+
+        for invalid in ([0, 0], [1, 1, 3], [0, 2, 1], [0, 0, 2]):
+            with pytest.raises(ValueError):
+                cls.from_terms_arrays(coeffs, actions, indices, np.array(invalid))
+
     def test_equiv(self):
         cls = self.get_class()
         op = cls.from_dict({(): 1e-7})
@@ -230,6 +293,13 @@ class FermionOperatorTests(ABC):
             expected = cls.from_dict({(): 1, ((True, 0), (False, 0)): -1})
             assert op.normal_ordered().equiv(expected)
 
+        with subtests.test("chop"):
+            op = cls.from_dict({((False, 0), (True, 0)): 1, ((True, 1),): 1e-10})
+            expected = cls.from_dict({(): 1, ((True, 0), (False, 0)): -1})
+            canon = op.normal_ordered(chop=1e-8)
+            assert len(canon) == 2
+            assert canon.equiv(expected)
+
     def test_is_hermitian(self):
         cls = self.get_class()
 
@@ -261,6 +331,22 @@ class FermionOperatorTests(ABC):
         with subtests.test("4"):
             assert op.many_body_order() == 4
 
+    def test_split_by_support(self):
+        cls = self.get_class()
+        op = cls.from_dict(
+            {
+                (): 1.0,
+                (cre(3), ann(1)): 2.0,
+                (cre(2), ann(2)): 3.0,
+                (cre(1), ann(3)): 4.0,
+            }
+        )
+        groups = op.split_by_support()
+        assert [support for support, _ in groups] == [[], [1, 3], [2]]
+        assert groups[0][1].equiv(cls.one())
+        assert groups[1][1].equiv(cls.from_dict({(cre(1), ann(0)): 2.0, (cre(0), ann(1)): 4.0}))
+        assert groups[2][1].equiv(cls.from_dict({(cre(0), ann(0)): 3.0}))
+
     def test_conserves_particle_number(self, subtests):
         cls = self.get_class()
 
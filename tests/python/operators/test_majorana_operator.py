@@ -12,6 +12,8 @@
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+import pytest
 from qiskit_fermions.operators import MajoranaOperator, gamma
 from qiskit_fermions.operators.library import anti_commutator, commutator
 
@@ -25,11 +27,15 @@ class MajoranaOperatorTests(ABC):
         cls = self.get_class()
         op = cls.zero()
         assert op.equiv(cls.from_dict({}))
+        op += cls.one()
+        assert cls.zero().equiv(cls.from_dict({}))
 
     def test_one(self):
         cls = self.get_class()
         op = cls.one()
         assert op.equiv(cls.from_dict({(): 1}))
+        op *= 2
+        assert cls.one().equiv(cls.from_dict({(): 1}))
 
     def test_repr(self):
         cls = self.get_class()
@@ -44,6 +50,15 @@ class MajoranaOperatorTests(ABC):
         )
         assert op.equiv(eval(repr(op)))
 
+    def test_to_dict(self):
+        cls = self.get_class()
+        data = {(): 2, (0, 1): 1, (3,): -0.5j}
+        op = cls.from_dict(data)
+        assert op.to_dict() == data
+        assert cls.from_dict(op.to_dict()).equiv(op)
+        op += cls.from_dict({(): 1})
+        assert op.to_dict() == {**data, (): 3}
+
     def test_len(self, subtests):
         cls = self.get_class()
 
@@ -61,6 +76,10 @@ class MajoranaOperatorTests(ABC):
         cls = self.get_class()
         op = cls.one()
         assert list(op.iter_terms()) == [([], 1)]
+        op = cls([1, 2, 3], [0, 1], [0, 0, 1, 2])
+        terms = op.iter_terms()
+        assert next(terms) == ([], 1)
+        assert list(terms) == [([0], 2), ([1], 3)]
 
     def test_ichop(self):
         cls = self.get_class()
@@ -70,6 +89,10 @@ class MajoranaOperatorTests(ABC):
         op.ichop(1e-5)
         assert op.equiv(cls.from_dict({(): 1e-4}))
 
+        op = cls.from_dict({(0,): 1e-10, (1,): 2j, (2,): 1 - 1j})
+        op.ichop()
+        assert op.equiv(cls.from_dict({(1,): 2j, (2,): 1 - 1j}))
+
     def test_simplify(self):
         cls = self.get_class()
         coeffs = [1e-10, 2, 3, 4, -4]
@@ -208,11 +231,31 @@ class MajoranaOperatorTests(ABC):
         with subtests.test("pow==2"):
             assert (op**2).equiv(cls.from_dict({(gamma(0, False), gamma(0, False)): 4}))
 
+        with subtests.test("pow==5"):
+            assert (op**5).equiv(cls.from_dict({(gamma(0, False),) * 5: 32}))
+
     def test_adjoint(self):
         cls = self.get_class()
         op = cls.from_dict({(): 2j, (gamma(0, False), gamma(0, True)): 3})
         assert op.adjoint().equiv(cls.from_dict({(): -2j, (gamma(0, True), gamma(0, False)): 3}))
 
+    def test_from_terms_arrays(self):
+        cls = self.get_class()
+        coeffs = np.array([2.0, 1j])
+        modes = np.array([1, 0, 3], dtype=np.uint32)
+        boundaries = np.array([0, 0, 3])
+        op = cls.from_terms_arrays(coeffs, modes, boundaries)
+        assert op == cls([2.0, 1j], [1, 0, 3], [0, 0, 3])
+        with pytest.raises(ValueError):
+            cls.from_terms_arrays(coeffs, modes, -boundaries)
+
+        real = cls.from_terms_arrays(coeffs.real, modes, boundaries)
+        assert real == cls([2.0, 0.0], [1, 0, 3], [0, 0, 3])
+
+        for invalid in ([0, 0], [1, 1, 3], [0, 2, 1], [0, 0, 2]):
+            with pytest.raises(ValueError):
+                cls.from_terms_arrays(coeffs, modes, np.array(invalid))
+
     def test_equiv(self):
         cls = self.get_class()
         op = cls.from_dict({(): 1e-7})
@@ -312,3 +355,11 @@ class TestMajoranaOperator(MajoranaOperatorTests):
     @staticmethod
     def get_class() -> type[MajoranaOperator]:
         return MajoranaOperator
+
+
+def test_gamma():
+    assert gamma(3, True) == gamma(3, 1) == 7
+    assert gamma(3, False) == gamma(3, 0) == 6
+    assert gamma(2**31 - 1, True) == 2**32 - 1
+    with pytest.raises(OverflowError):
+        gamma(2**31, False)